@@ -1,5 +1,82 @@
 from typing import Dict, List, Tuple
 import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _knapsack_fill(weights: np.ndarray, values: np.ndarray, capacity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fills the 0/1 knapsack table as a single rolling row.
+
+    Returns the final row and a bit-matrix (np.packbits layout) marking the
+    (item, capacity) cells where taking the item improved the value.
+    """
+    n = weights.shape[0]
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    taken = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8)
+
+    for i in range(n):
+        weight = weights[i]
+        value = values[i]
+        # Right-to-left so dp[w - weight] still holds the previous row
+        for w in range(capacity, weight - 1, -1):
+            candidate = value + dp[w - weight]
+            if candidate > dp[w]:
+                dp[w] = candidate
+                taken[i, w >> 3] |= np.uint8(0x80 >> (w & 7))
+
+    return dp, taken
+
+@njit(cache=True)
+def _lcs_fill(s1_codes: np.ndarray, s2_codes: np.ndarray) -> np.ndarray:
+    """Fills the LCS table for two arrays of character codes."""
+    m = s1_codes.shape[0]
+    n = s2_codes.shape[0]
+    dp = np.zeros((m + 1, n + 1), dtype=np.int64)
+
+    for i in range(1, m + 1):
+        code = s1_codes[i-1]
+        prev = dp[i-1]
+        row = dp[i]
+        for j in range(1, n + 1):
+            if code == s2_codes[j-1]:
+                row[j] = prev[j-1] + 1
+            else:
+                row[j] = max(prev[j], row[j-1])
+
+    return dp
+
+# Cost of a sub-chain that has not been computed yet in the int64 table
+_UNSET_COST = np.iinfo(np.int64).max
+
+@njit(cache=True)
+def _matrix_chain_fill(dims: np.ndarray, unset) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fills the matrix chain cost and split tables.
+
+    The cost table takes the type of unset, which marks cells not yet
+    computed: int64 with _UNSET_COST, or float64 with inf.
+    """
+    n = dims.shape[0] - 1
+    dp = np.full((n, n), unset)
+    parenthesis = np.zeros((n, n), dtype=np.int64)
+    np.fill_diagonal(dp, 0)
+
+    for chain_len in range(2, n + 1):
+        for i in range(n - chain_len + 1):
+            j = i + chain_len - 1
+            best = dp[i, j]
+            for k in range(i, j):
+                cost = dp[i, k] + dp[k+1, j] + dims[i] * dims[k+1] * dims[j+1]
+                if cost < best:
+                    best = cost
+                    parenthesis[i, j] = k
+            dp[i, j] = best
+
+    return dp, parenthesis
+
+def _char_codes(s: str) -> np.ndarray:
+    """Converts a string to an array of Unicode code points."""
+    return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
 
 def knapsack(weights: List[int], values: List[int], capacity: int) -> List[Dict]:
     """
@@ -11,50 +88,60 @@ def knapsack(weights: List[int], values: List[int], capacity: int) -> List[Dict]
         capacity: Knapsack capacity
         
     Returns:
-        List of steps for visualization
+        List of steps for visualization; fill steps only carry the updated
+        cell (expanded by materializeDpSteps in frontend/src/services/api.ts)
     """
     n = len(weights)
-    dp = np.zeros((n + 1, capacity + 1), dtype=int)
+    _, taken = _knapsack_fill(
+        np.asarray(weights, dtype=np.int64),
+        np.asarray(values, dtype=np.int64),
+        capacity
+    )
+    row = np.zeros(capacity + 1, dtype=np.int64)
+    dp_table = [row.tolist()]
     steps: List[Dict] = []
     
     # Initialize the visualization state
     steps.append({
         'type': 'knapsack',
-        'dp_table': dp.tolist(),
+        'dp_table': [[0] * (capacity + 1) for _ in range(n + 1)],
         'current_item': None,
         'current_capacity': None,
         'selected_items': [],
         'message': 'Starting 0/1 Knapsack algorithm'
     })
     
-    # Fill the dp table
+    # Rebuild each row from the previous one and the taken bits, recording
+    # only the cell written at each step
     for i in range(1, n + 1):
+        took = np.flatnonzero(np.unpackbits(taken[i-1], count=capacity + 1))
+        row = row.copy()
+        row[took] = values[i-1] + row[took - weights[i-1]]
+        dp_row = row.tolist()
+        dp_table.append(dp_row)
+
         for w in range(capacity + 1):
             steps.append({
                 'type': 'knapsack',
-                'dp_table': dp.tolist(),
+                'cell': [i, w],
+                'value': dp_row[w],
                 'current_item': i - 1,
                 'current_capacity': w,
                 'selected_items': [],
                 'message': f'Considering item {i} with weight {weights[i-1]} and value {values[i-1]} for capacity {w}'
             })
             
-            if weights[i-1] <= w:
-                dp[i][w] = max(values[i-1] + dp[i-1][w-weights[i-1]], dp[i-1][w])
-            else:
-                dp[i][w] = dp[i-1][w]
-    
     # Backtrack to find selected items
     selected_items = []
     w = capacity
     for i in range(n, 0, -1):
-        if dp[i][w] != dp[i-1][w]:
+        if taken[i-1, w >> 3] & (0x80 >> (w & 7)):
             selected_items.append(i-1)
             w -= weights[i-1]
             
             steps.append({
                 'type': 'knapsack',
-                'dp_table': dp.tolist(),
+                'dp_table': dp_table,
                 'current_item': i - 1,
                 'current_capacity': w,
                 'selected_items': selected_items.copy(),
@@ -64,11 +151,11 @@ def knapsack(weights: List[int], values: List[int], capacity: int) -> List[Dict]
     # Add final step
     steps.append({
         'type': 'knapsack',
-        'dp_table': dp.tolist(),
+        'dp_table': dp_table,
         'current_item': None,
         'current_capacity': None,
         'selected_items': selected_items,
-        'message': f'Final solution: total value = {dp[n][capacity]}'
+        'message': f'Final solution: total value = {dp_table[n][capacity]}'
     })
     
     return steps
@@ -82,16 +169,18 @@ def lcs(str1: str, str2: str) -> List[Dict]:
         str2: Second string
         
     Returns:
-        List of steps for visualization
+        List of steps for visualization; fill steps only carry the updated
+        cell (expanded by materializeDpSteps in frontend/src/services/api.ts)
     """
     m, n = len(str1), len(str2)
-    dp = np.zeros((m + 1, n + 1), dtype=int)
+    dp = _lcs_fill(_char_codes(str1), _char_codes(str2))
+    dp_table = dp.tolist()
     steps: List[Dict] = []
     
     # Initialize the visualization state
     steps.append({
         'type': 'lcs',
-        'dp_table': dp.tolist(),
+        'dp_table': np.zeros_like(dp).tolist(),
         'str1': str1,
         'str2': str2,
         'current_i': None,
@@ -100,12 +189,13 @@ def lcs(str1: str, str2: str) -> List[Dict]:
         'message': 'Starting Longest Common Subsequence algorithm'
     })
     
-    # Fill the dp table
+    # Replay the fill, recording only the cell written at each step
     for i in range(1, m + 1):
         for j in range(1, n + 1):
             steps.append({
                 'type': 'lcs',
-                'dp_table': dp.tolist(),
+                'cell': [i, j],
+                'value': dp_table[i][j],
                 'str1': str1,
                 'str2': str2,
                 'current_i': i - 1,
@@ -113,11 +203,6 @@ def lcs(str1: str, str2: str) -> List[Dict]:
                 'lcs_chars': [],
                 'message': f'Comparing characters {str1[i-1]} and {str2[j-1]}'
             })
-            
-            if str1[i-1] == str2[j-1]:
-                dp[i][j] = dp[i-1][j-1] + 1
-            else:
-                dp[i][j] = max(dp[i-1][j], dp[i][j-1])
     
     # Backtrack to find LCS
     lcs_chars = []
@@ -129,7 +214,7 @@ def lcs(str1: str, str2: str) -> List[Dict]:
             j -= 1
             steps.append({
                 'type': 'lcs',
-                'dp_table': dp.tolist(),
+                'dp_table': dp_table,
                 'str1': str1,
                 'str2': str2,
                 'current_i': i,
@@ -137,7 +222,7 @@ def lcs(str1: str, str2: str) -> List[Dict]:
                 'lcs_chars': lcs_chars.copy(),
                 'message': f'Found matching character: {str1[i]}'
             })
-        elif dp[i-1][j] > dp[i][j-1]:
+        elif dp_table[i-1][j] > dp_table[i][j-1]:
             i -= 1
         else:
             j -= 1
@@ -147,7 +232,7 @@ def lcs(str1: str, str2: str) -> List[Dict]:
     # Add final step
     steps.append({
         'type': 'lcs',
-        'dp_table': dp.tolist(),
+        'dp_table': dp_table,
         'str1': str1,
         'str2': str2,
         'current_i': None,
@@ -166,21 +251,29 @@ def matrix_chain(dimensions: List[int]) -> List[Dict]:
         dimensions: List of matrix dimensions
         
     Returns:
-        List of steps for visualization
+        List of steps for visualization; fill steps only carry the updated
+        cell (expanded by materializeDpSteps in frontend/src/services/api.ts)
     """
     n = len(dimensions) - 1
-    dp = np.full((n, n), float('inf'))
-    parenthesis = np.zeros((n, n), dtype=int)
+    # Every sub-chain costs at most (n - 1) * max(d)**3; fill in float64 when
+    # that could overflow int64, which loses precision instead of wrapping
+    if max(map(abs, dimensions), default=0) ** 3 * max(n - 1, 0) < _UNSET_COST:
+        dims, unset = np.asarray(dimensions, dtype=np.int64), _UNSET_COST
+    else:
+        dims, unset = np.asarray(dimensions, dtype=np.float64), np.inf
+    dp, parenthesis = _matrix_chain_fill(dims, unset)
+    # Unfilled cells are shown as infinity, as in the initial snapshot
+    dp_table = np.where(dp == unset, np.inf, dp).tolist()
     steps: List[Dict] = []
     
-    # Initialize diagonal
-    for i in range(n):
-        dp[i][i] = 0
+    # Initial state: only the diagonal is known
+    initial = np.full((n, n), np.inf)
+    np.fill_diagonal(initial, 0)
     
     steps.append({
         'type': 'matrix_chain',
-        'dp_table': dp.tolist(),
-        'parenthesis': parenthesis.tolist(),
+        'dp_table': initial.tolist(),
+        'parenthesis': np.zeros_like(parenthesis).tolist(),
         'current_len': None,
         'current_i': None,
         'current_j': None,
@@ -188,15 +281,15 @@ def matrix_chain(dimensions: List[int]) -> List[Dict]:
         'message': 'Starting Matrix Chain Multiplication algorithm'
     })
     
-    # Fill the dp table
+    # Replay the fill; sub-chain costs are final by the time they are read
     for chain_len in range(2, n + 1):
         for i in range(n - chain_len + 1):
             j = i + chain_len - 1
+            best = float('inf')
+            split = 0
             
             steps.append({
                 'type': 'matrix_chain',
-                'dp_table': dp.tolist(),
-                'parenthesis': parenthesis.tolist(),
                 'current_len': chain_len,
                 'current_i': i,
                 'current_j': j,
@@ -205,13 +298,18 @@ def matrix_chain(dimensions: List[int]) -> List[Dict]:
             })
             
             for k in range(i, j):
-                cost = (dp[i][k] + dp[k+1][j] +
+                cost = (dp_table[i][k] + dp_table[k+1][j] +
                        dimensions[i] * dimensions[k+1] * dimensions[j+1])
+
+                if cost < best:
+                    best = cost
+                    split = k
                 
                 steps.append({
                     'type': 'matrix_chain',
-                    'dp_table': dp.tolist(),
-                    'parenthesis': parenthesis.tolist(),
+                    'cell': [i, j],
+                    'value': best,
+                    'split': split,
                     'current_len': chain_len,
                     'current_i': i,
                     'current_j': j,
@@ -219,14 +317,10 @@ def matrix_chain(dimensions: List[int]) -> List[Dict]:
                     'message': f'Trying split at k={k}, cost={cost}'
                 })
                 
-                if cost < dp[i][j]:
-                    dp[i][j] = cost
-                    parenthesis[i][j] = k
-    
     # Add final step
     steps.append({
         'type': 'matrix_chain',
-        'dp_table': dp.tolist(),
+        'dp_table': dp_table,
         'parenthesis': parenthesis.tolist(),
         'current_len': None,
         'current_i': None,
@@ -235,4 +329,4 @@ def matrix_chain(dimensions: List[int]) -> List[Dict]:
         'message': f'Minimum number of multiplications: {int(dp[0][n-1])}'
     })
     
-    return steps 
\ No newline at end of file
+    return steps
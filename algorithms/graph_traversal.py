@@ -1,299 +1,730 @@
-from typing import Dict, List, Set, Tuple, Callable
-from collections import deque
-import heapq
+from typing import Dict, Generator, Iterator, List, Tuple, Callable
+from functools import lru_cache
+import math
+import numpy as np
 import networkx as nx
+from numba import njit
 from .utils import create_step
 
-def dfs(graph: nx.Graph, start: str) -> List[Dict]:
+def _check_nodes(graph: nx.Graph, *nodes: str) -> None:
+    """Raises NodeNotFound for the first of nodes that is not in graph."""
+    for node in nodes:
+        if node not in graph:
+            raise nx.NodeNotFound(f"Node {node} is not in the graph")
+
+def _to_csr(graph: nx.Graph) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
     """
-    Depth-First Search implementation that returns visualization steps.
-    
+    Builds a CSR adjacency representation of a graph in one pass over its adjacency.
+
+    Neighbors keep NetworkX's adjacency order, so traversals over the CSR arrays
+    visit nodes in the same order as graph.neighbors().
+
+    Args:
+        graph: NetworkX graph object
+
+    Returns:
+        Tuple of (node_list, indptr, indices, weights); the neighbors of node
+        node_list[u] are indices[indptr[u]:indptr[u+1]]
+    """
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+    indices: List[int] = []
+    weights: List[float] = []
+
+    for u, node in enumerate(nodes):
+        for neighbor, data in graph.adj[node].items():
+            indices.append(index[neighbor])
+            weights.append(data.get('weight', 1))
+        indptr[u + 1] = len(indices)
+
+    return (
+        nodes,
+        indptr,
+        np.array(indices, dtype=np.int32),
+        np.array(weights, dtype=np.float64)
+    )
+
+def to_csr(graph: nx.Graph) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts a graph to CSR arrays for the array-based entry points such as bfs_csr.
+
+    Node i is the i-th node of graph.nodes(); convert once and reuse the
+    arrays when running many searches over the same graph.
+
+    Args:
+        graph: NetworkX graph object
+
+    Returns:
+        Tuple of (indptr, indices, weights)
+    """
+    _, indptr, indices, weights = _to_csr(graph)
+    return indptr, indices, weights
+
+@njit(cache=True)
+def _heap_push(keys: np.ndarray, items: np.ndarray, size: int, key: float, item: int) -> int:
+    """Pushes (key, item) onto an array-backed binary min-heap and returns the new size."""
+    pos = size
+    keys[pos] = key
+    items[pos] = item
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if keys[parent] < keys[pos] or (keys[parent] == keys[pos] and items[parent] <= items[pos]):
+            break
+        keys[pos], keys[parent] = keys[parent], keys[pos]
+        items[pos], items[parent] = items[parent], items[pos]
+        pos = parent
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(keys: np.ndarray, items: np.ndarray, size: int) -> Tuple[float, int, int]:
+    """Pops the smallest (key, item) from an array-backed binary min-heap; returns it and the new size."""
+    key = keys[0]
+    item = items[0]
+    size -= 1
+    keys[0] = keys[size]
+    items[0] = items[size]
+    pos = 0
+    while True:
+        smallest = pos
+        for child in (2 * pos + 1, 2 * pos + 2):
+            if child < size and (keys[child] < keys[smallest] or
+                                 (keys[child] == keys[smallest] and items[child] < items[smallest])):
+                smallest = child
+        if smallest == pos:
+            break
+        keys[pos], keys[smallest] = keys[smallest], keys[pos]
+        items[pos], items[smallest] = items[smallest], items[pos]
+        pos = smallest
+    return key, item, size
+
+# Direction-optimizing BFS thresholds (Beamer et al.): switch to pull steps
+# once the frontier's edges exceed 1/ALPHA of the unexplored edges, and back
+# to push once the frontier shrinks below 1/BETA of the nodes. Small graphs
+# always push so their visit order stays the textbook one.
+_PULL_ALPHA = 14
+_PUSH_BETA = 24
+_PULL_MIN_NODES = 1024
+
+def _to_csc(indptr: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Transposes a CSR adjacency (out-neighbors) into CSC form (in-neighbors)."""
+    n = indptr.shape[0] - 1
+    sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+    by_target = np.argsort(indices, kind='stable')
+    cs_indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(np.bincount(indices, minlength=n), out=cs_indptr[1:])
+    return cs_indptr, sources[by_target]
+
+@njit(cache=True)
+def _bfs_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    cs_indptr: np.ndarray,
+    cs_indices: np.ndarray,
+    start: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Direction-optimizing breadth-first search over CSR (out) and CSC (in) adjacencies.
+
+    Each level either pushes from the frontier's out-neighbors or, when the
+    frontier is large, pulls: every unvisited node checks its in-neighbors
+    against a bit-packed frontier set and stops at the first hit.
+
+    Returns the visit order and the BFS-tree parent of every node (-1 for the
+    start and for unreachable nodes).
+    """
+    n = indptr.shape[0] - 1
+    order = np.empty(n, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    discovered = np.zeros(n, dtype=np.uint8)
+    frontier_bits = np.zeros((n + 7) // 8, dtype=np.uint8)
+
+    order[0] = start
+    discovered[start] = 1
+    unexplored_edges = indices.shape[0] - (indptr[start + 1] - indptr[start])
+    level_start, level_end = 0, 1
+    pulling = False
+    while level_start < level_end:
+        frontier_edges = 0
+        for i in range(level_start, level_end):
+            u = order[i]
+            frontier_edges += indptr[u + 1] - indptr[u]
+
+        if n >= _PULL_MIN_NODES:
+            if not pulling and frontier_edges * _PULL_ALPHA > unexplored_edges:
+                pulling = True
+            elif pulling and (level_end - level_start) * _PUSH_BETA < n:
+                pulling = False
+
+        tail = level_end
+        if pulling:
+            for i in range(level_start, level_end):
+                u = order[i]
+                frontier_bits[u >> 3] |= np.uint8(0x80 >> (u & 7))
+            for v in range(n):
+                if discovered[v]:
+                    continue
+                for k in range(cs_indptr[v], cs_indptr[v + 1]):
+                    u = cs_indices[k]
+                    if frontier_bits[u >> 3] & (0x80 >> (u & 7)):
+                        discovered[v] = 1
+                        parent[v] = u
+                        order[tail] = v
+                        tail += 1
+                        break
+            frontier_bits[:] = 0
+        else:
+            for i in range(level_start, level_end):
+                u = order[i]
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if not discovered[v]:
+                        discovered[v] = 1
+                        parent[v] = u
+                        order[tail] = v
+                        tail += 1
+
+        for i in range(level_end, tail):
+            v = order[i]
+            unexplored_edges -= indptr[v + 1] - indptr[v]
+        level_start, level_end = level_end, tail
+
+    return order[:level_end], parent
+
+@njit(cache=True)
+def _dijkstra_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    start: int,
+    end: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Dijkstra's algorithm over a CSR adjacency, stopping once end is processed.
+
+    Returns (dist, parent, event_from, event_node, event_dist). Each event is
+    either a node being processed (event_from == -1) or a distance update
+    event_from -> event_node with the new distance.
+    """
+    n = indptr.shape[0] - 1
+    max_events = n + indices.shape[0]
+    dist = np.full(n, np.inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.uint8)
+    event_from = np.empty(max_events, dtype=np.int64)
+    event_node = np.empty(max_events, dtype=np.int64)
+    event_dist = np.empty(max_events, dtype=np.float64)
+    heap_keys = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    heap_items = np.empty(indices.shape[0] + 1, dtype=np.int64)
+
+    dist[start] = 0.0
+    size = _heap_push(heap_keys, heap_items, 0, 0.0, start)
+    count = 0
+    while size > 0:
+        _, u, size = _heap_pop(heap_keys, heap_items, size)
+        if visited[u]:
+            continue
+
+        visited[u] = 1
+        event_from[count] = -1
+        event_node[count] = u
+        event_dist[count] = dist[u]
+        count += 1
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not visited[v]:
+                new_distance = dist[u] + weights[k]
+                if new_distance < dist[v]:
+                    dist[v] = new_distance
+                    parent[v] = u
+                    size = _heap_push(heap_keys, heap_items, size, new_distance, v)
+                    event_from[count] = u
+                    event_node[count] = v
+                    event_dist[count] = new_distance
+                    count += 1
+
+        if u == end:
+            break
+
+    return dist, parent, event_from[:count], event_node[:count], event_dist[:count]
+
+@njit(cache=True)
+def _astar_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    h: np.ndarray,
+    start: int,
+    end: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    A* search over a CSR adjacency with a precomputed heuristic h[v] to end.
+
+    Returns (g_score, came_from, event_from, event_node, event_dist) with the
+    same event encoding as _dijkstra_csr.
+    """
+    n = indptr.shape[0] - 1
+    max_events = n + indices.shape[0]
+    g_score = np.full(n, np.inf)
+    f_score = np.full(n, np.inf)
+    came_from = np.full(n, -1, dtype=np.int64)
+    visited = np.zeros(n, dtype=np.uint8)
+    event_from = np.empty(max_events, dtype=np.int64)
+    event_node = np.empty(max_events, dtype=np.int64)
+    event_dist = np.empty(max_events, dtype=np.float64)
+    heap_keys = np.empty(indices.shape[0] + 1, dtype=np.float64)
+    heap_items = np.empty(indices.shape[0] + 1, dtype=np.int64)
+
+    g_score[start] = 0.0
+    f_score[start] = h[start]
+    size = _heap_push(heap_keys, heap_items, 0, h[start], start)
+    count = 0
+    while size > 0:
+        current_f, u, size = _heap_pop(heap_keys, heap_items, size)
+        if current_f > f_score[u]:
+            continue
+        if u == end:
+            break
+
+        visited[u] = 1
+        event_from[count] = -1
+        event_node[count] = u
+        event_dist[count] = g_score[u]
+        count += 1
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if visited[v]:
+                continue
+            tentative_g_score = g_score[u] + weights[k]
+            if tentative_g_score < g_score[v]:
+                came_from[v] = u
+                g_score[v] = tentative_g_score
+                f_score[v] = tentative_g_score + h[v]
+                size = _heap_push(heap_keys, heap_items, size, f_score[v], v)
+                event_from[count] = u
+                event_node[count] = v
+                event_dist[count] = tentative_g_score
+                count += 1
+
+    return g_score, came_from, event_from[:count], event_node[:count], event_dist[:count]
+
+def iter_dfs(graph: nx.Graph, start: str) -> Iterator[Dict]:
+    """
+    Depth-First Search implementation that yields visualization steps.
+
     Args:
         graph: NetworkX graph object
         start: Starting node
-        
+
     Returns:
-        List of steps for visualization
-    """
-    visited: Set[str] = set()
-    steps: List[Dict] = []
-    
-    def dfs_recursive(node: str) -> None:
-        visited.add(node)
-        steps.append(create_step(
+        Iterator over steps for visualization
+    """
+    _check_nodes(graph, start)
+    nodes, indptr, indices, _ = _to_csr(graph)
+    indptr, indices = indptr.tolist(), indices.tolist()
+    source = nodes.index(start)
+    visited = bytearray(len(nodes))
+    order: List[str] = []
+
+    def visit(u: int) -> Dict:
+        visited[u] = 1
+        order.append(nodes[u])
+        return create_step(
             graph,
-            visited=list(visited),
-            current=node,
-            message=f"Visiting node {node}"
-        ))
-        
-        for neighbor in graph.neighbors(node):
-            if neighbor not in visited:
-                steps.append(create_step(
-                    graph,
-                    visited=list(visited),
-                    current=node,
-                    next_node=neighbor,
-                    message=f"Exploring edge {node} -> {neighbor}"
-                ))
-                dfs_recursive(neighbor)
-    
-    steps.append(create_step(
+            visited=list(order),
+            current=nodes[u],
+            message=f"Visiting node {nodes[u]}"
+        )
+
+    yield create_step(
         graph,
         visited=[],
         current=start,
         message=f"Starting DFS from node {start}"
-    ))
-    dfs_recursive(start)
-    return steps
+    )
 
-def bfs(graph: nx.Graph, start: str) -> List[Dict]:
+    # Explicit stack of (node, iterator over its remaining neighbors)
+    yield visit(source)
+    stack = [(source, iter(indices[indptr[source]:indptr[source + 1]]))]
+    while stack:
+        u, neighbors = stack[-1]
+        for v in neighbors:
+            if not visited[v]:
+                yield create_step(
+                    graph,
+                    visited=list(order),
+                    current=nodes[u],
+                    next_node=nodes[v],
+                    message=f"Exploring edge {nodes[u]} -> {nodes[v]}"
+                )
+                yield visit(v)
+                stack.append((v, iter(indices[indptr[v]:indptr[v + 1]])))
+                break
+        else:
+            stack.pop()
+
+def dfs(graph: nx.Graph, start: str, visualize: bool = True) -> List:
     """
-    Breadth-First Search implementation that returns visualization steps.
-    
+    Depth-First Search implementation that returns visualization steps.
+
+    Args:
+        graph: NetworkX graph object
+        start: Starting node
+        visualize: Record visualization steps; if False, only run the search
+
+    Returns:
+        List of steps for visualization, or the DFS tree edges if visualize is False
+    """
+    _check_nodes(graph, start)
+    if not visualize:
+        return list(nx.dfs_edges(graph, start))
+    return list(iter_dfs(graph, start))
+
+def _bfs_graph_csr(
+    graph: nx.Graph,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    start: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Runs _bfs_csr on a graph's CSR arrays, transposing them first for directed graphs."""
+    if graph.is_directed():
+        cs_indptr, cs_indices = _to_csc(indptr, indices)
+    else:
+        cs_indptr, cs_indices = indptr, indices
+    return _bfs_csr(indptr, indices, cs_indptr, cs_indices, start)
+
+def iter_bfs(graph: nx.Graph, start: str) -> Iterator[Dict]:
+    """
+    Breadth-First Search implementation that yields visualization steps.
+
     Args:
         graph: NetworkX graph object
         start: Starting node
-        
+
     Returns:
-        List of steps for visualization
+        Iterator over steps for visualization
     """
-    visited: Set[str] = set()
-    queue: deque = deque([start])
-    steps: List[Dict] = []
-    
-    steps.append(create_step(
+    _check_nodes(graph, start)
+    nodes, indptr, indices, _ = _to_csr(graph)
+    order, parent = _bfs_graph_csr(graph, indptr, indices, nodes.index(start))
+    order_names = [nodes[u] for u in order.tolist()]
+
+    # Children are listed under the parent that discovered them
+    children: List[List[int]] = [[] for _ in nodes]
+    for v in order[1:].tolist():
+        children[parent[v]].append(v)
+
+    yield create_step(
         graph,
         visited=[],
         current=start,
         message=f"Starting BFS from node {start}"
-    ))
-    
-    while queue:
-        node = queue.popleft()
-        if node not in visited:
-            visited.add(node)
-            steps.append(create_step(
+    )
+
+    for i, u in enumerate(order.tolist()):
+        visited = order_names[:i + 1]
+        yield create_step(
+            graph,
+            visited=visited,
+            current=nodes[u],
+            message=f"Visiting node {nodes[u]}"
+        )
+
+        for v in children[u]:
+            yield create_step(
                 graph,
-                visited=list(visited),
-                current=node,
-                message=f"Visiting node {node}"
-            ))
-            
-            for neighbor in graph.neighbors(node):
-                if neighbor not in visited:
-                    queue.append(neighbor)
-                    steps.append(create_step(
-                        graph,
-                        visited=list(visited),
-                        current=node,
-                        next_node=neighbor,
-                        message=f"Adding {neighbor} to queue"
-                    ))
-    
-    return steps
-
-def dijkstra(graph: nx.Graph, start: str, end: str) -> List[Dict]:
+                visited=visited,
+                current=nodes[u],
+                next_node=nodes[v],
+                message=f"Adding {nodes[v]} to queue"
+            )
+
+def bfs(graph: nx.Graph, start: str, visualize: bool = True) -> List:
     """
-    Dijkstra's shortest path algorithm implementation that returns visualization steps.
-    
+    Breadth-First Search implementation that returns visualization steps.
+
+    Args:
+        graph: NetworkX graph object
+        start: Starting node
+        visualize: Record visualization steps; if False, only run the search
+
+    Returns:
+        List of steps for visualization, or the BFS tree edges if visualize is False
+    """
+    _check_nodes(graph, start)
+    if not visualize:
+        return list(nx.bfs_edges(graph, start))
+    return list(iter_bfs(graph, start))
+
+def bfs_csr(indptr: np.ndarray, indices: np.ndarray, start: int) -> np.ndarray:
+    """
+    Breadth-First Search over the CSR arrays of an undirected graph, without visualization.
+
+    Args:
+        indptr: CSR row pointers from to_csr
+        indices: CSR column indices from to_csr
+        start: Index of the starting node
+
+    Returns:
+        Node indices in visit order
+    """
+    # An undirected adjacency is its own transpose, so it doubles as the CSC
+    order, _ = _bfs_csr(indptr, indices, indptr, indices, start)
+    return order
+
+def _replay_search(
+    graph: nx.Graph,
+    nodes: List[str],
+    start: str,
+    events: Tuple[np.ndarray, np.ndarray, np.ndarray],
+    process_message: str
+) -> Generator[Dict, None, Tuple[List[str], List[float]]]:
+    """
+    Rebuilds visualization steps from the event log of a jitted search core.
+
+    Steps carry no distance snapshot; each update step records the changed
+    distance in 'distance_update' instead; the frontend rebuilds full
+    distances with materializeGraphSteps (frontend/src/services/api.ts).
+
+    Yields the steps and returns the processed nodes in order and the
+    replayed distances.
+    """
+    distances = [float('infinity')] * len(nodes)
+    distances[nodes.index(start)] = 0
+    order: List[str] = []
+
+    for u, v, distance in zip(*(event.tolist() for event in events)):
+        if u == -1:
+            order.append(nodes[v])
+            yield create_step(
+                graph,
+                visited=list(order),
+                current=nodes[v],
+                message=process_message.format(node=nodes[v])
+            )
+        else:
+            distances[v] = distance
+            yield create_step(
+                graph,
+                visited=list(order),
+                current=nodes[u],
+                next_node=nodes[v],
+                distance_update=(nodes[v], distance),
+                message=f"Updated distance to {nodes[v]}: {distance}"
+            )
+
+    return order, distances
+
+def _reconstruct_path(nodes: List[str], parent: np.ndarray, target: int) -> List[str]:
+    """Follows parent pointers back from target and returns the path as node labels."""
+    path = []
+    current = target
+    while parent[current] != -1:
+        path.append(nodes[current])
+        current = parent[current]
+    path.append(nodes[current])
+    path.reverse()
+    return path
+
+def iter_dijkstra(graph: nx.Graph, start: str, end: str) -> Iterator[Dict]:
+    """
+    Dijkstra's shortest path algorithm implementation that yields visualization steps.
+
     Args:
         graph: NetworkX graph object
         start: Starting node
         end: Target node
-        
+
     Returns:
-        List of steps for visualization
-    """
-    distances: Dict[str, float] = {node: float('infinity') for node in graph.nodes()}
-    distances[start] = 0
-    visited: Set[str] = set()
-    previous: Dict[str, str] = {}
-    steps: List[Dict] = []
-    
-    steps.append(create_step(
+        Iterator over steps for visualization
+    """
+    _check_nodes(graph, start, end)
+    nodes, indptr, indices, weights = _to_csr(graph)
+    source, target = nodes.index(start), nodes.index(end)
+    _, previous, *events = _dijkstra_csr(indptr, indices, weights, source, target)
+
+    yield create_step(
         graph,
         visited=[],
         current=start,
-        distances=distances,
+        distances={node: (0 if node == start else float('infinity')) for node in nodes},
         message=f"Starting Dijkstra's algorithm from node {start}"
-    ))
-    
-    while len(visited) < len(graph.nodes()):
-        # Find unvisited node with minimum distance
-        min_distance = float('infinity')
-        current_node = None
-        
-        for node in graph.nodes():
-            if node not in visited and distances[node] < min_distance:
-                min_distance = distances[node]
-                current_node = node
-        
-        if current_node is None or distances[current_node] == float('infinity'):
-            break
-            
-        visited.add(current_node)
-        steps.append(create_step(
+    )
+
+    order, distances = yield from _replay_search(
+        graph, nodes, start, events, "Processing node {node}"
+    )
+
+    if end in order:
+        path = _reconstruct_path(nodes, previous, target)
+        yield create_step(
             graph,
-            visited=list(visited),
-            current=current_node,
-            distances=distances,
-            message=f"Processing node {current_node}"
-        ))
-        
-        # Update distances to neighbors
-        for neighbor in graph.neighbors(current_node):
-            if neighbor not in visited:
-                weight = graph[current_node][neighbor].get('weight', 1)
-                new_distance = distances[current_node] + weight
-                
-                if new_distance < distances[neighbor]:
-                    distances[neighbor] = new_distance
-                    previous[neighbor] = current_node
-                    steps.append(create_step(
-                        graph,
-                        visited=list(visited),
-                        current=current_node,
-                        next_node=neighbor,
-                        distances=distances,
-                        message=f"Updated distance to {neighbor}: {new_distance}"
-                    ))
-        
-        if current_node == end:
-            # Reconstruct path
-            path = []
-            current = end
-            while current in previous:
-                path.append(current)
-                current = previous[current]
-            path.append(start)
-            path.reverse()
-            
-            steps.append(create_step(
-                graph,
-                visited=list(visited),
-                path=path,
-                distances=distances,
-                message=f"Found shortest path: {' -> '.join(path)}"
-            ))
-            break
-    
-    return steps 
+            visited=list(order),
+            path=path,
+            distances=dict(zip(nodes, distances)),
+            message=f"Found shortest path: {' -> '.join(path)}"
+        )
 
-def astar(
+def dijkstra(graph: nx.Graph, start: str, end: str, visualize: bool = True) -> List:
+    """
+    Dijkstra's shortest path algorithm implementation that returns visualization steps.
+
+    Args:
+        graph: NetworkX graph object
+        start: Starting node
+        end: Target node
+        visualize: Record visualization steps; if False, only run the search
+
+    Returns:
+        List of steps for visualization, or the shortest path if visualize is False
+        (empty if end is unreachable)
+    """
+    _check_nodes(graph, start, end)
+    if not visualize:
+        try:
+            return nx.dijkstra_path(graph, start, end, weight='weight')
+        except nx.NetworkXNoPath:
+            return []
+    return list(iter_dijkstra(graph, start, end))
+
+@lru_cache(maxsize=8)
+def _astar_csr_inputs(
+    graph: nx.Graph,
+    node_count: int,
+    edge_count: int
+) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds the CSR arrays of a graph for A*.
+
+    Cached so repeated searches on the same graph skip the rebuild. The node
+    and edge counts are part of the key so adding or removing nodes or edges
+    invalidates the entry; changing weights in place does not. The returned
+    arrays are shared between calls and marked read-only.
+    """
+    nodes, indptr, indices, weights = _to_csr(graph)
+    for array in (indptr, indices, weights):
+        array.flags.writeable = False
+    return nodes, indptr, indices, weights
+
+@lru_cache(maxsize=8)
+def _astar_default_heuristic(
+    graph: nx.Graph,
+    node_count: int,
+    edge_count: int,
+    end: str
+) -> np.ndarray:
+    """
+    Builds the default Euclidean heuristic towards an A* goal.
+
+    Cached like _astar_csr_inputs, so repeated searches towards the same
+    goal (e.g. while only the start changes) skip the rebuild; changing
+    positions in place does not invalidate the entry. The returned array is
+    shared between calls and marked read-only.
+    """
+    nodes, *_ = _astar_csr_inputs(graph, node_count, edge_count)
+
+    # Default to Euclidean distance if coordinates are available
+    positions = np.array(
+        [pos for _, pos in graph.nodes(data='pos', default=(0, 0))], dtype=np.float64
+    )
+    h = np.linalg.norm(positions - positions[nodes.index(end)], axis=1)
+    h.flags.writeable = False
+    return h
+
+def iter_astar(
     graph: nx.Graph,
     start: str,
     end: str,
     heuristic_fn: Callable[[str, str], float] = None
-) -> List[Dict]:
+) -> Iterator[Dict]:
     """
-    A* pathfinding algorithm implementation that returns visualization steps.
-    
+    A* pathfinding algorithm implementation that yields visualization steps.
+
     Args:
         graph: NetworkX graph object
         start: Starting node
         end: Target node
         heuristic_fn: Function to estimate distance to goal (defaults to Euclidean distance)
-        
+
     Returns:
-        List of steps for visualization
+        Iterator over steps for visualization
     """
+    _check_nodes(graph, start, end)
+    key = (graph, graph.number_of_nodes(), graph.number_of_edges())
+    nodes, indptr, indices, weights = _astar_csr_inputs(*key)
+    source, target = nodes.index(start), nodes.index(end)
+
     if heuristic_fn is None:
-        # Default to Euclidean distance if coordinates are available
-        def heuristic_fn(node1: str, node2: str) -> float:
-            pos1 = graph.nodes[node1].get('pos', (0, 0))
-            pos2 = graph.nodes[node2].get('pos', (0, 0))
-            return ((pos1[0] - pos2[0]) ** 2 + (pos1[1] - pos2[1]) ** 2) ** 0.5
-    
-    steps: List[Dict] = []
-    
-    # Priority queue entries are (f_score, node)
-    open_set = [(0 + heuristic_fn(start, end), start)]
-    heapq.heapify(open_set)
-    
-    # For node n, g_score[n] is the cost of the cheapest path from start to n currently known
-    g_score = {node: float('infinity') for node in graph.nodes()}
-    g_score[start] = 0
-    
-    # For node n, f_score[n] = g_score[n] + h(n)
-    f_score = {node: float('infinity') for node in graph.nodes()}
-    f_score[start] = heuristic_fn(start, end)
-    
-    # For node n, came_from[n] is the node immediately preceding it on the cheapest path from start
-    came_from = {}
-    
-    visited = set()
-    
-    steps.append(create_step(
+        h = _astar_default_heuristic(*key, end)
+    else:
+        # The search never looks at nodes it cannot reach, so the heuristic
+        # is only evaluated on those reachable from start
+        reachable, _ = _bfs_graph_csr(graph, indptr, indices, source)
+        h = np.zeros(len(nodes), dtype=np.float64)
+        h[reachable] = [heuristic_fn(nodes[u], end) for u in reachable.tolist()]
+
+    _, came_from, *events = _astar_csr(indptr, indices, weights, h, source, target)
+
+    yield create_step(
         graph,
-        visited=list(visited),
+        visited=[],
         current=start,
-        distances=g_score,
+        distances={node: (0 if node == start else float('infinity')) for node in nodes},
         message=f"Starting A* search from {start} to {end}"
-    ))
-    
-    while open_set:
-        current_f, current = heapq.heappop(open_set)
-        
-        if current == end:
-            # Reconstruct path
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
-            
-            steps.append(create_step(
-                graph,
-                visited=list(visited),
-                path=path,
-                distances=g_score,
-                message=f"Found path: {' -> '.join(path)}"
-            ))
-            break
-        
-        visited.add(current)
-        steps.append(create_step(
+    )
+
+    order, distances = yield from _replay_search(
+        graph, nodes, start, events, "Exploring node {node}"
+    )
+
+    if target == source or came_from[target] != -1:
+        path = _reconstruct_path(nodes, came_from, target)
+        yield create_step(
             graph,
-            visited=list(visited),
-            current=current,
-            distances=g_score,
-            message=f"Exploring node {current}"
-        ))
-        
-        for neighbor in graph.neighbors(current):
-            if neighbor in visited:
-                continue
-                
-            # tentative_g_score is the distance from start to neighbor through current
-            tentative_g_score = g_score[current] + graph[current][neighbor].get('weight', 1)
-            
-            if tentative_g_score < g_score[neighbor]:
-                # This path to neighbor is better than any previous one
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic_fn(neighbor, end)
-                
-                steps.append(create_step(
-                    graph,
-                    visited=list(visited),
-                    current=current,
-                    next_node=neighbor,
-                    distances=g_score,
-                    message=f"Updated distance to {neighbor}: {tentative_g_score}"
-                ))
-                
-                # Add neighbor to open set if not already there
-                if not any(node == neighbor for _, node in open_set):
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-    
-    if not any(node == end for _, node in open_set):
-        steps.append(create_step(
+            visited=list(order),
+            path=path,
+            distances=dict(zip(nodes, distances)),
+            message=f"Found path: {' -> '.join(path)}"
+        )
+    else:
+        yield create_step(
             graph,
-            visited=list(visited),
-            distances=g_score,
+            visited=list(order),
+            distances=dict(zip(nodes, distances)),
             message=f"No path found from {start} to {end}"
-        ))
-    
-    return steps 
\ No newline at end of file
+        )
+
+def astar(
+    graph: nx.Graph,
+    start: str,
+    end: str,
+    heuristic_fn: Callable[[str, str], float] = None,
+    visualize: bool = True
+) -> List:
+    """
+    A* pathfinding algorithm implementation that returns visualization steps.
+
+    Args:
+        graph: NetworkX graph object
+        start: Starting node
+        end: Target node
+        heuristic_fn: Function to estimate distance to goal (defaults to Euclidean distance)
+        visualize: Record visualization steps; if False, only run the search
+
+    Returns:
+        List of steps for visualization, or the path found if visualize is False
+        (empty if end is unreachable)
+    """
+    _check_nodes(graph, start, end)
+    if not visualize:
+        if heuristic_fn is None:
+            positions = dict(graph.nodes(data='pos', default=(0, 0)))
+            def heuristic_fn(n1, n2):
+                return math.dist(positions[n1], positions[n2])
+        try:
+            return nx.astar_path(graph, start, end, heuristic=heuristic_fn, weight='weight')
+        except nx.NetworkXNoPath:
+            return []
+    return list(iter_astar(graph, start, end, heuristic_fn))
@@ -1,8 +1,115 @@
-from typing import Dict, List, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable
+from collections import deque
+import heapq
 import numpy as np
+from numba import njit
 from scipy.optimize import linprog, minimize
 import networkx as nx
 
+# Problems up to this size are solved with the tableau method so that every
+# pivot can be visualized; anything larger goes straight to HiGHS
+_TABLEAU_MAX_VARS = 20
+_TABLEAU_MAX_CONSTRAINTS = 20
+_PIVOT_EPS = 1e-9
+
+@njit(cache=True)
+def _select_pivot(tableau: np.ndarray, basis: np.ndarray) -> Tuple[int, int]:
+    """
+    Picks the next pivot of a minimization tableau using Bland's rule.
+    
+    Returns (row, col); col is -1 when the tableau is optimal and row is -1
+    when the objective is unbounded along the entering column.
+    """
+    m = tableau.shape[0] - 1
+    n = tableau.shape[1] - 1
+    
+    col = -1
+    for j in range(n):
+        if tableau[m, j] < -_PIVOT_EPS:
+            col = j
+            break
+    if col == -1:
+        return -1, -1
+    
+    row = -1
+    best_ratio = np.inf
+    for i in range(m):
+        a = tableau[i, col]
+        if a > _PIVOT_EPS:
+            ratio = tableau[i, n] / a
+            if ratio < best_ratio - _PIVOT_EPS or (
+                ratio < best_ratio + _PIVOT_EPS and row != -1 and basis[i] < basis[row]
+            ):
+                best_ratio = ratio
+                row = i
+    return row, col
+
+@njit(cache=True)
+def _pivot(tableau: np.ndarray, basis: np.ndarray, row: int, col: int) -> None:
+    """Pivots the tableau in place on (row, col)."""
+    tableau[row] /= tableau[row, col]
+    for i in range(tableau.shape[0]):
+        if i != row:
+            factor = tableau[i, col]
+            if factor != 0.0:
+                tableau[i] -= factor * tableau[row]
+    basis[row] = col
+
+def _objective_value(value: float) -> float:
+    """Converts an objective value to a float, normalizing -0.0 to 0.0."""
+    return float(value) + 0.0
+
+def _tableau_simplex(c: List[float], A: List[List[float]], b: List[float], maximize: bool, steps: List[Dict]) -> None:
+    """Runs the tableau simplex for A x <= b, x >= 0 with b >= 0, appending a step per pivot."""
+    m, n = len(A), len(c)
+    sign = -1 if maximize else 1
+    
+    # [A | I | b] with the reduced costs in the last row
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n] = A
+    tableau[:m, n:n + m] = np.eye(m)
+    tableau[:m, -1] = b
+    tableau[m, :n] = c
+    basis = np.arange(n, n + m)
+    
+    while True:
+        row, col = _select_pivot(tableau, basis)
+        if col == -1:
+            break
+        if row == -1:
+            steps.append({
+                'type': 'simplex',
+                'tableau': tableau.tolist(),
+                'basic_vars': basis.tolist(),
+                'current_pivot': None,
+                'objective_value': None,
+                'message': f'Objective is unbounded along variable {col}'
+            })
+            return
+        
+        _pivot(tableau, basis, row, col)
+        steps.append({
+            'type': 'simplex',
+            'tableau': tableau.tolist(),
+            'basic_vars': basis.tolist(),
+            'current_pivot': [row, col],
+            'objective_value': _objective_value(sign * -tableau[m, -1]),
+            'message': f'Pivoting on row {row}, column {col}'
+        })
+    
+    solution = np.zeros(n + m)
+    solution[basis] = tableau[:m, -1]
+    objective_value = _objective_value(sign * -tableau[m, -1])
+    steps.append({
+        'type': 'simplex',
+        'tableau': tableau.tolist(),
+        'basic_vars': basis.tolist(),
+        'current_pivot': None,
+        'objective_value': objective_value,
+        'solution': solution[:n].tolist(),
+        'message': f'Found optimal solution with objective value: {objective_value}'
+    })
+
 def simplex(
     c: List[float],
     A: List[List[float]],
@@ -12,6 +119,10 @@ def simplex(
     """
     Simplex algorithm implementation for linear programming that returns visualization steps.
     
+    Small problems whose origin is feasible (b >= 0) are solved with a tableau
+    simplex so every pivot is shown; the rest are solved with HiGHS and only
+    report the optimum.
+    
     Args:
         c: Coefficients of the objective function
         A: Matrix of coefficients for the constraints
@@ -37,23 +148,29 @@ def simplex(
         'message': 'Starting Simplex algorithm'
     })
     
+    if (0 < len(A) <= _TABLEAU_MAX_CONSTRAINTS and len(c) <= _TABLEAU_MAX_VARS
+            and min(b) >= 0):
+        _tableau_simplex(c, A, b, maximize, steps)
+        return steps
+    
     # Solve using scipy's linprog
     result = linprog(
         c,
         A_ub=A,
         b_ub=b,
-        method='simplex'
+        method='highs'
     )
     
     if result.success:
+        objective_value = _objective_value(-result.fun if maximize else result.fun)
         steps.append({
             'type': 'simplex',
             'tableau': result.tableau.tolist() if hasattr(result, 'tableau') else None,
             'basic_vars': [],
             'current_pivot': None,
-            'objective_value': -result.fun if maximize else result.fun,
+            'objective_value': objective_value,
             'solution': result.x.tolist(),
-            'message': f'Found optimal solution with objective value: {-result.fun if maximize else result.fun}'
+            'message': f'Found optimal solution with objective value: {objective_value}'
         })
     else:
         steps.append({
@@ -67,6 +184,13 @@ def simplex(
     
     return steps
 
+def _graph_snapshot(graph: nx.DiGraph) -> Dict:
+    """Copies the nodes and edge attributes of a flow graph for a visualization step."""
+    return {
+        'nodes': list(graph.nodes()),
+        'edges': [(u, v, dict(data)) for u, v, data in graph.edges(data=True)],
+    }
+
 def max_flow(graph: nx.DiGraph, source: str, sink: str) -> List[Dict]:
     """
     Ford-Fulkerson algorithm implementation for maximum flow that returns visualization steps.
@@ -77,7 +201,11 @@ def max_flow(graph: nx.DiGraph, source: str, sink: str) -> List[Dict]:
         sink: Sink node
         
     Returns:
-        List of steps for visualization
+        List of steps for visualization. Only the first and last steps carry
+        the full graph; augmentation steps carry the path and its flow 'delta',
+        which adds to each path edge and subtracts from its reverse edge
+        (created with capacity 0 when missing); the frontend replays them with
+        materializeFlowSteps (frontend/src/services/api.ts)
     """
     steps: List[Dict] = []
     flow_graph = graph.copy()
@@ -87,26 +215,29 @@ def max_flow(graph: nx.DiGraph, source: str, sink: str) -> List[Dict]:
         flow_graph[u][v]['flow'] = 0
     
     def find_path(g: nx.DiGraph, s: str, t: str) -> Tuple[bool, List[Tuple[str, str]]]:
-        visited = {s}
-        stack = [(s, [])]
-        while stack:
-            vertex, path = stack.pop()
+        # Breadth-first search for the shortest augmenting path (Edmonds-Karp)
+        parent: Dict[str, Optional[str]] = {s: None}
+        queue = deque([s])
+        while queue:
+            vertex = queue.popleft()
             for neighbor in g.neighbors(vertex):
                 residual = g[vertex][neighbor]['capacity'] - g[vertex][neighbor]['flow']
-                if residual > 0 and neighbor not in visited:
+                if residual > 0 and neighbor not in parent:
+                    parent[neighbor] = vertex
                     if neighbor == t:
-                        return True, path + [(vertex, neighbor)]
-                    visited.add(neighbor)
-                    stack.append((neighbor, path + [(vertex, neighbor)]))
+                        path = []
+                        while parent[neighbor] is not None:
+                            path.append((parent[neighbor], neighbor))
+                            neighbor = parent[neighbor]
+                        path.reverse()
+                        return True, path
+                    queue.append(neighbor)
         return False, []
     
     # Initialize visualization
     steps.append({
         'type': 'max_flow',
-        'graph': {
-            'nodes': list(flow_graph.nodes()),
-            'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-        },
+        'graph': _graph_snapshot(flow_graph),
         'current_path': None,
         'total_flow': 0,
         'message': 'Starting Ford-Fulkerson algorithm'
@@ -136,11 +267,8 @@ def max_flow(graph: nx.DiGraph, source: str, sink: str) -> List[Dict]:
         
         steps.append({
             'type': 'max_flow',
-            'graph': {
-                'nodes': list(flow_graph.nodes()),
-                'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-            },
             'current_path': path,
+            'delta': min_residual,
             'total_flow': total_flow,
             'message': f'Found augmenting path with flow {min_residual}'
         })
@@ -148,10 +276,7 @@ def max_flow(graph: nx.DiGraph, source: str, sink: str) -> List[Dict]:
     # Add final step
     steps.append({
         'type': 'max_flow',
-        'graph': {
-            'nodes': list(flow_graph.nodes()),
-            'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-        },
+        'graph': _graph_snapshot(flow_graph),
         'current_path': None,
         'total_flow': total_flow,
         'message': f'Maximum flow: {total_flow}'
@@ -175,7 +300,10 @@ def min_cost_flow(
         demand: Required flow value
         
     Returns:
-        List of steps for visualization
+        List of steps for visualization. Only the first and last steps carry
+        the full graph; augmentation steps carry the path and the flow 'delta'
+        added to each of its edges (replayed by materializeFlowSteps in
+        frontend/src/services/api.ts)
     """
     steps: List[Dict] = []
     flow_graph = graph.copy()
@@ -184,43 +312,73 @@ def min_cost_flow(
     for u, v in flow_graph.edges():
         flow_graph[u][v]['flow'] = 0
     
-    def find_shortest_path(g: nx.DiGraph, s: str, t: str) -> Tuple[bool, List[Tuple[str, str]], float]:
+    def bellman_ford(g: nx.DiGraph, s: str) -> Dict[str, float]:
         distances = {node: float('inf') for node in g.nodes()}
         distances[s] = 0
-        previous = {node: None for node in g.nodes()}
         
-        # Bellman-Ford algorithm
         for _ in range(len(g.nodes()) - 1):
-            for u, v in g.edges():
+            updated = False
+            for u, v, data in g.edges(data=True):
+                if data['capacity'] - data['flow'] > 0:
+                    if distances[u] + data['cost'] < distances[v]:
+                        distances[v] = distances[u] + data['cost']
+                        updated = True
+            
+            # No relaxation in a full pass means the distances are final
+            if not updated:
+                break
+        
+        return distances
+    
+    # Node potentials keep reduced costs non-negative so each augmentation can
+    # use Dijkstra; Bellman-Ford is only needed up front for negative costs
+    if any(d['cost'] < 0 for _, _, d in flow_graph.edges(data=True)):
+        potential = bellman_ford(flow_graph, source)
+    else:
+        potential = {node: 0 for node in flow_graph.nodes()}
+    
+    def find_shortest_path(g: nx.DiGraph, s: str, t: str) -> Tuple[bool, List[Tuple[str, str]], float]:
+        # Dijkstra on reduced costs cost + potential[u] - potential[v]
+        distances = {s: 0}
+        previous = {}
+        visited = set()
+        queue = [(0, s)]
+        
+        while queue:
+            distance, u = heapq.heappop(queue)
+            if u in visited:
+                continue
+            visited.add(u)
+            
+            for v in g.neighbors(u):
                 residual = g[u][v]['capacity'] - g[u][v]['flow']
                 if residual > 0:
-                    cost = g[u][v]['cost']
-                    if distances[u] + cost < distances[v]:
-                        distances[v] = distances[u] + cost
+                    reduced_cost = g[u][v]['cost'] + potential[u] - potential[v]
+                    if distance + reduced_cost < distances.get(v, float('inf')):
+                        distances[v] = distance + reduced_cost
                         previous[v] = u
+                        heapq.heappush(queue, (distances[v], v))
         
-        if distances[t] == float('inf'):
+        if t not in distances:
             return False, [], 0
+        
+        for node, distance in distances.items():
+            potential[node] += distance
             
         # Reconstruct path
         path = []
         current = t
-        while current is not None:
-            prev = previous[current]
-            if prev is not None:
-                path.append((prev, current))
-            current = prev
+        while current in previous:
+            path.append((previous[current], current))
+            current = previous[current]
         path.reverse()
         
-        return True, path, distances[t]
+        return True, path, sum(g[u][v]['cost'] for u, v in path)
     
     # Initialize visualization
     steps.append({
         'type': 'min_cost_flow',
-        'graph': {
-            'nodes': list(flow_graph.nodes()),
-            'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-        },
+        'graph': _graph_snapshot(flow_graph),
         'current_path': None,
         'total_flow': 0,
         'total_cost': 0,
@@ -252,11 +410,8 @@ def min_cost_flow(
         
         steps.append({
             'type': 'min_cost_flow',
-            'graph': {
-                'nodes': list(flow_graph.nodes()),
-                'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-            },
             'current_path': path,
+            'delta': min_residual,
             'total_flow': total_flow,
             'total_cost': total_cost,
             'message': f'Found path with flow {min_residual} and cost {path_cost}'
@@ -265,10 +420,7 @@ def min_cost_flow(
     # Add final step
     steps.append({
         'type': 'min_cost_flow',
-        'graph': {
-            'nodes': list(flow_graph.nodes()),
-            'edges': [(u, v, flow_graph[u][v]) for u, v in flow_graph.edges()],
-        },
+        'graph': _graph_snapshot(flow_graph),
         'current_path': None,
         'total_flow': total_flow,
         'total_cost': total_cost,
@@ -277,13 +429,28 @@ def min_cost_flow(
     
     return steps
 
+@njit('float64(float64[:])', cache=True, fastmath=True)
+def sum_of_squares(x: np.ndarray) -> float:
+    """Example objective for gradient descent: the sum of squared coordinates."""
+    total = 0.0
+    for i in range(x.shape[0]):
+        total += x[i] * x[i]
+    return total
+
+@njit('float64[:](float64[:])', cache=True, fastmath=True)
+def sum_of_squares_gradient(x: np.ndarray) -> np.ndarray:
+    """Gradient of sum_of_squares."""
+    return 2.0 * x
+
 def gradient_descent(
     objective_fn: Callable[[np.ndarray], float],
     gradient_fn: Callable[[np.ndarray], np.ndarray],
     initial_point: np.ndarray,
     learning_rate: float = 0.01,
     max_iterations: int = 1000,
-    tolerance: float = 1e-6
+    tolerance: float = 1e-6,
+    method: str = 'standard',
+    momentum: float = 0.9
 ) -> List[Dict]:
     """
     Gradient descent implementation for nonlinear optimization.
@@ -295,45 +462,74 @@ def gradient_descent(
         learning_rate: Learning rate for gradient updates
         max_iterations: Maximum number of iterations
         tolerance: Convergence tolerance
+        method: 'standard' for fixed-step descent or 'nesterov' for
+            Nesterov-accelerated descent
+        momentum: Velocity decay (mu) used by the 'nesterov' method
         
     Returns:
         List of steps for visualization
     """
+    if method not in ('standard', 'nesterov'):
+        raise ValueError(f'Unknown gradient descent method: {method}')
+    
     steps: List[Dict] = []
-    current_point = initial_point.copy()
+    current_point = np.array(initial_point, dtype=float)
+    update = np.empty_like(current_point)
+    velocity = np.zeros_like(current_point)
+    lookahead = np.empty_like(current_point)
+    
+    # Objective value and gradient are each evaluated once per point and
+    # carried into the next iteration
+    value = float(objective_fn(current_point))
+    gradient = np.asarray(gradient_fn(current_point), dtype=float)
     
     steps.append({
         'type': 'nonlinear',
         'point': current_point.tolist(),
-        'objective_value': float(objective_fn(current_point)),
-        'gradient': gradient_fn(current_point).tolist(),
+        'objective_value': value,
+        'gradient': gradient.tolist(),
         'iteration': 0,
         'message': 'Starting gradient descent optimization'
     })
     
     for i in range(max_iterations):
-        gradient = gradient_fn(current_point)
-        new_point = current_point - learning_rate * gradient
+        if method == 'nesterov':
+            # v = mu * v - lr * grad(x + mu * v); x += v. The velocity starts
+            # at zero, so the first look-ahead point is the starting point.
+            velocity *= momentum
+            if i > 0:
+                np.add(current_point, velocity, out=lookahead)
+                gradient = np.asarray(gradient_fn(lookahead), dtype=float)
+        elif i > 0:
+            gradient = np.asarray(gradient_fn(current_point), dtype=float)
+        gradient_norm = np.linalg.norm(gradient)
+        
+        # In-place update: current_point -= learning_rate * gradient
+        np.multiply(gradient, learning_rate, out=update)
+        if method == 'nesterov':
+            velocity -= update
+            current_point += velocity
+        else:
+            current_point -= update
         
         # Calculate improvement
-        old_value = objective_fn(current_point)
-        new_value = objective_fn(new_point)
-        improvement = old_value - new_value
+        new_value = float(objective_fn(current_point))
+        improvement = value - new_value
         
         steps.append({
             'type': 'nonlinear',
-            'point': new_point.tolist(),
-            'objective_value': float(new_value),
+            'point': current_point.tolist(),
+            'objective_value': new_value,
             'gradient': gradient.tolist(),
             'iteration': i + 1,
-            'improvement': float(improvement),
+            'improvement': improvement,
             'message': f'Iteration {i+1}: objective value = {new_value:.6f}'
         })
         
-        if np.linalg.norm(gradient) < tolerance:
+        if gradient_norm < tolerance:
             break
             
-        current_point = new_point
+        value = new_value
     
     return steps
 
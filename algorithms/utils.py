@@ -1,88 +1,148 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+import hashlib
+import json
+import numpy as np
 import networkx as nx
+from numba import njit
+
+# State names indexed by the codes used in create_step
+_NODE_STATES = np.array(['unvisited', 'visited', 'current', 'next', 'path'])
+_EDGE_STATES = np.array(['normal', 'path'])
+
+@lru_cache(maxsize=8)
+def _step_layout(graph: nx.Graph, node_count: int, edge_count: int) -> Tuple:
+    """
+    Collects the per-graph columns shared by every step of a visualization.
+    
+    Keyed like graph_traversal._astar_csr_inputs: the node and edge counts
+    invalidate the entry when the structure changes, but attribute edits
+    in place do not. The returned lists are shared between steps.
+    """
+    # Read attributes through the data views rather than graph.nodes[node]
+    node_data = list(graph.nodes(data='value', default=1))
+    node_list = [node for node, _ in node_data]
+    node_index = {node: i for i, node in enumerate(node_list)}
+    edge_list = list(graph.edges(data='weight', default=1))
+    
+    return (
+        node_list,
+        node_index,
+        [str(node) for node in node_list],
+        [value for _, value in node_data],
+        [str(u) for u, _, _ in edge_list],
+        [str(v) for _, v, _ in edge_list],
+        [weight for _, _, weight in edge_list],
+        np.array([node_index[u] for u, _, _ in edge_list], dtype=np.int32),
+        np.array([node_index[v] for _, v, _ in edge_list], dtype=np.int32)
+    )
+
+@njit(cache=True)
+def _step_states(
+    visited_idx: np.ndarray,
+    current: int,
+    next_idx: int,
+    path_idx: np.ndarray,
+    source_idx: np.ndarray,
+    target_idx: np.ndarray,
+    node_count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the node and edge state codes of a step over integer node ids.
+    
+    current and next_idx are -1 when absent. Later states take precedence:
+    visited < current < next < path.
+    """
+    node_states = np.zeros(node_count, dtype=np.int8)
+    for u in visited_idx:
+        node_states[u] = 1
+    if current >= 0:
+        node_states[current] = 2
+    if next_idx >= 0:
+        node_states[next_idx] = 3
+    
+    # Path edges join nodes that are adjacent in the path
+    path_pos = np.full(node_count, -1, dtype=np.int32)
+    for i in range(path_idx.shape[0]):
+        path_pos[path_idx[i]] = i
+        node_states[path_idx[i]] = 4
+    
+    edge_states = np.zeros(source_idx.shape[0], dtype=np.int8)
+    if path_idx.shape[0] > 0:
+        for k in range(source_idx.shape[0]):
+            source_pos = path_pos[source_idx[k]]
+            target_pos = path_pos[target_idx[k]]
+            if source_pos >= 0 and target_pos >= 0 and abs(source_pos - target_pos) == 1:
+                edge_states[k] = 1
+    
+    return node_states, edge_states
 
 def create_step(
     graph: nx.Graph,
     visited: List[str],
-    current: str,
+    current: Optional[str] = None,
     next_node: Optional[str] = None,
     distances: Optional[Dict[str, float]] = None,
+    distance_update: Optional[Tuple[str, float]] = None,
     path: Optional[List[str]] = None,
     message: str = ""
 ) -> Dict[str, Any]:
     """
     Creates a visualization step with the current state of the algorithm.
     
+    Nodes and edges are emitted as parallel columns ('node_ids',
+    'node_states', 'edge_sources', ...) rather than a list of dicts per
+    node and edge.
+    
     Args:
         graph: NetworkX graph object
         visited: List of visited nodes
-        current: Current node being processed
+        current: Current node being processed (optional)
         next_node: Next node to be processed (optional)
         distances: Dictionary of distances from start node (optional)
+        distance_update: (node, distance) pair changed since the last snapshot (optional)
         path: List of nodes in the current path (optional)
         message: Description of the current step
         
     Returns:
         Dictionary containing the step information
     """
-    nodes = []
-    edges = []
-    
-    # Process nodes
-    for node in graph.nodes():
-        node_data = {
-            'id': str(node),
-            'value': graph.nodes[node].get('value', 1),
-            'state': 'unvisited'
-        }
-        
-        if node in visited:
-            node_data['state'] = 'visited'
-        if node == current:
-            node_data['state'] = 'current'
-        if next_node and node == next_node:
-            node_data['state'] = 'next'
-            
-        if distances:
-            node_data['distance'] = distances[node]
-            
-        if path and node in path:
-            node_data['state'] = 'path'
-            
-        nodes.append(node_data)
-    
-    # Process edges
-    for source, target in graph.edges():
-        edge_data = {
-            'source': str(source),
-            'target': str(target),
-            'weight': graph[source][target].get('weight', 1),
-            'state': 'normal'
-        }
-        
-        if path and source in path and target in path:
-            # Check if these nodes are adjacent in the path
-            source_idx = path.index(source)
-            target_idx = path.index(target)
-            if abs(source_idx - target_idx) == 1:
-                edge_data['state'] = 'path'
-                
-        edges.append(edge_data)
+    (node_list, node_index, node_ids, node_values, edge_sources, edge_targets,
+     edge_weights, source_idx, target_idx) = _step_layout(
+        graph, graph.number_of_nodes(), graph.number_of_edges()
+    )
+    
+    node_states, edge_states = _step_states(
+        np.array([node_index[node] for node in visited], dtype=np.int32),
+        node_index.get(current, -1),
+        node_index.get(next_node, -1) if next_node else -1,
+        np.array([node_index[node] for node in path] if path else [], dtype=np.int32),
+        source_idx,
+        target_idx,
+        len(node_list)
+    )
     
     return {
-        'nodes': nodes,
-        'edges': edges,
+        'node_ids': node_ids,
+        'node_states': _NODE_STATES[node_states].tolist(),
+        'node_values': node_values,
+        'node_distances': [distances[node] for node in node_list] if distances else None,
+        'edge_sources': edge_sources,
+        'edge_targets': edge_targets,
+        'edge_weights': edge_weights,
+        'edge_states': _EDGE_STATES[edge_states].tolist(),
         'visited': visited,
         'current': current,
         'next': next_node,
         'distances': distances,
+        'distance_update': list(distance_update) if distance_update else None,
         'path': path,
         'message': message
     }
 
-def create_sample_graph() -> nx.Graph:
+def _build_sample_graph() -> nx.Graph:
     """
-    Creates a sample graph for testing and demonstration.
+    Builds the sample graph for testing and demonstration.
     
     Returns:
         NetworkX graph object
@@ -109,4 +169,35 @@ def create_sample_graph() -> nx.Graph:
     for source, target, weight in edges:
         G.add_edge(source, target, weight=weight)
     
-    return G 
\ No newline at end of file
+    return G
+
+# Built once at import; frozen so shared readers cannot modify it
+_SAMPLE_GRAPH = nx.freeze(_build_sample_graph())
+
+# Serialized /graph/sample response body and its ETag
+SAMPLE_GRAPH_JSON = json.dumps({
+    'nodes': [{'id': node} for node in _SAMPLE_GRAPH.nodes()],
+    'edges': [
+        {'source': u, 'target': v, 'weight': d.get('weight', 1)}
+        for u, v, d in _SAMPLE_GRAPH.edges(data=True)
+    ]
+}).encode('utf-8')
+SAMPLE_GRAPH_ETAG = hashlib.sha1(SAMPLE_GRAPH_JSON).hexdigest()
+
+def create_sample_graph() -> nx.Graph:
+    """
+    Creates a sample graph for testing and demonstration.
+    
+    Returns:
+        A mutable copy of the sample graph
+    """
+    return _SAMPLE_GRAPH.copy()
+
+def get_sample_graph() -> nx.Graph:
+    """
+    Returns the shared sample graph for callers that only read it.
+    
+    Returns:
+        Frozen NetworkX graph object
+    """
+    return _SAMPLE_GRAPH
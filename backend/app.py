@@ -1,76 +1,137 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+import orjson
 from dotenv import load_dotenv
 import os
 import traceback
-from algorithms.graph_traversal import dfs, bfs, dijkstra, astar
-from algorithms.dynamic_programming import knapsack, lcs, matrix_chain
-from algorithms.optimization import (
-    simplex,
-    max_flow,
-    min_cost_flow,
-    gradient_descent,
-    constrained_optimization
-)
-from algorithms.utils import create_sample_graph
+from functools import lru_cache, partial
+from importlib import import_module
+from typing import Callable, Dict, Tuple
 from utils.benchmarking import analyze_complexity, estimate_complexity
+from utils.streaming import steps_response
+
+# Algorithm modules pull in NumPy, SciPy, NetworkX and Numba, so they are
+# imported inside the routes that use them to keep cold starts (and /health)
+# cheap
+
+# Benchmarkable algorithms: URL name -> (module, function), imported on use
+_ALGO_MAP = {
+    'dfs': ('algorithms.graph_traversal', 'dfs'),
+    'bfs': ('algorithms.graph_traversal', 'bfs'),
+    'dijkstra': ('algorithms.graph_traversal', 'dijkstra'),
+    'astar': ('algorithms.graph_traversal', 'astar'),
+    'knapsack': ('algorithms.dynamic_programming', 'knapsack'),
+    'lcs': ('algorithms.dynamic_programming', 'lcs'),
+    'matrix-chain': ('algorithms.dynamic_programming', 'matrix_chain'),
+}
 
 # Load environment variables
 load_dotenv()
 
+# Tracebacks are only included in error responses during development
+DEBUG = os.getenv('FLASK_DEBUG') == '1'
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for the large step payloads."""
+    
+    # numpy arrays and scalars serialize natively; graphs with integer
+    # labels produce non-string dict keys
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of via str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=self.options),
+            mimetype='application/json'
+        )
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Reject oversized request bodies before any handler parses them
+app.config['MAX_CONTENT_LENGTH'] = 1_000_000
 CORS(app)
 
+@app.before_request
+def load_json_body():
+    # The Lambda handler stores the body it already parsed in g.json_body
+    if 'json_body' not in g:
+        g.json_body = request.get_json() if request.method == 'POST' else None
+
 # Error handling
 @app.errorhandler(Exception)
 def handle_error(error):
-    return jsonify({
-        'error': str(error),
-        'traceback': traceback.format_exc()
-    }), 500
+    # Keep the status of HTTP errors such as 404 and 413
+    if isinstance(error, HTTPException):
+        return jsonify({'error': error.description}), error.code
+    payload = {'error': str(error)}
+    if DEBUG:
+        payload['traceback'] = traceback.format_exc()
+    return jsonify(payload), 500
+
+# Basic health check endpoint; the payload is shared with the Lambda handler
+HEALTH_JSON = orjson.dumps({'status': 'healthy', 'message': 'AlgoVis API is running'})
 
-# Basic health check endpoint
 @app.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({'status': 'healthy', 'message': 'AlgoVis API is running'})
+    return Response(HEALTH_JSON, mimetype='application/json')
 
 # Algorithm categories endpoints
+# The categories never change, so the payload is serialized once at import
+CATEGORIES_JSON = orjson.dumps({
+    'graph_traversal': ['dfs', 'bfs', 'dijkstra', 'astar'],
+    'dynamic_programming': ['knapsack', 'lcs', 'matrix_chain'],
+    'optimization': ['linear_programming', 'min_cost_flow', 'max_flow', 'gradient_descent', 'constrained'],
+    'shortest_paths': ['bellman_ford', 'floyd_warshall']
+})
+CATEGORIES_CACHE_CONTROL = 'public, max-age=3600'
+
 @app.route('/api/algorithms', methods=['GET'])
 def get_algorithm_categories():
-    categories = {
-        'graph_traversal': ['dfs', 'bfs', 'dijkstra', 'astar'],
-        'dynamic_programming': ['knapsack', 'lcs', 'matrix_chain'],
-        'optimization': ['linear_programming', 'min_cost_flow', 'max_flow', 'gradient_descent', 'constrained'],
-        'shortest_paths': ['bellman_ford', 'floyd_warshall']
-    }
-    return jsonify(categories)
+    return Response(
+        CATEGORIES_JSON,
+        mimetype='application/json',
+        headers={'Cache-Control': CATEGORIES_CACHE_CONTROL}
+    )
 
 # Graph traversal endpoints
 @app.route('/api/graph/sample', methods=['GET'])
 def get_sample_graph():
-    graph = create_sample_graph()
-    return jsonify({
-        'nodes': [{'id': n} for n in graph.nodes()],
-        'edges': [{'source': u, 'target': v, 'weight': d['weight']} 
-                 for u, v, d in graph.edges(data=True)]
-    })
+    from algorithms.utils import SAMPLE_GRAPH_JSON, SAMPLE_GRAPH_ETAG
+    
+    # The sample graph is static, so its payload is serialized once at import
+    response = Response(SAMPLE_GRAPH_JSON, mimetype='application/json')
+    response.set_etag(SAMPLE_GRAPH_ETAG)
+    return response.make_conditional(request)
 
 @app.route('/api/graph/traverse/<algorithm>', methods=['POST'])
 def traverse_graph(algorithm):
+    from networkx import NodeNotFound
+    from algorithms.graph_traversal import iter_dfs, iter_bfs, iter_dijkstra, iter_astar
+    from algorithms.utils import get_sample_graph as shared_sample_graph
+    
     try:
-        data = request.get_json()
-        graph = create_sample_graph()  # For now, using sample graph
+        data = g.json_body
+        graph = shared_sample_graph()  # For now, using sample graph
         start = data.get('start', 'A')
         end = data.get('end')
         
         if algorithm == 'dfs':
-            steps = dfs(graph, start)
+            steps = iter_dfs(graph, start)
         elif algorithm == 'bfs':
-            steps = bfs(graph, start)
+            steps = iter_bfs(graph, start)
         elif algorithm == 'dijkstra':
             if not end:
                 return jsonify({'error': 'End node required for Dijkstra\'s algorithm'}), 400
-            steps = dijkstra(graph, start, end)
+            steps = iter_dijkstra(graph, start, end)
         elif algorithm == 'astar':
             if not end:
                 return jsonify({'error': 'End node required for A* algorithm'}), 400
@@ -79,19 +140,24 @@ def traverse_graph(algorithm):
                 pos1 = graph.nodes[n1].get('pos', (0, 0))
                 pos2 = graph.nodes[n2].get('pos', (0, 0))
                 return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-            steps = astar(graph, start, end, heuristic)
+            steps = iter_astar(graph, start, end, heuristic)
         else:
             return jsonify({'error': f'Unknown algorithm: {algorithm}'}), 400
             
-        return jsonify({'steps': steps})
+        # Streams NDJSON when the client accepts it
+        return steps_response(steps)
+    except NodeNotFound as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 # Dynamic programming endpoints
 @app.route('/api/dp/knapsack', methods=['POST'])
 def solve_knapsack():
+    from algorithms.dynamic_programming import knapsack
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         weights = data.get('weights', [2, 3, 4, 5])
         values = data.get('values', [3, 4, 5, 6])
         capacity = data.get('capacity', 10)
@@ -103,8 +169,10 @@ def solve_knapsack():
 
 @app.route('/api/dp/lcs', methods=['POST'])
 def solve_lcs():
+    from algorithms.dynamic_programming import lcs
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         str1 = data.get('str1', 'ABCDGH')
         str2 = data.get('str2', 'AEDFHR')
         
@@ -115,8 +183,10 @@ def solve_lcs():
 
 @app.route('/api/dp/matrix-chain', methods=['POST'])
 def solve_matrix_chain():
+    from algorithms.dynamic_programming import matrix_chain
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         dimensions = data.get('dimensions', [30, 35, 15, 5, 10, 20, 25])
         
         steps = matrix_chain(dimensions)
@@ -127,8 +197,10 @@ def solve_matrix_chain():
 # Optimization endpoints
 @app.route('/api/optimization/simplex', methods=['POST'])
 def solve_simplex():
+    from algorithms.optimization import simplex
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         c = data.get('objective')
         A = data.get('constraints')
         b = data.get('bounds')
@@ -141,8 +213,11 @@ def solve_simplex():
 
 @app.route('/api/optimization/max-flow', methods=['POST'])
 def solve_max_flow():
+    from algorithms.optimization import max_flow
+    from algorithms.utils import create_sample_graph
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         graph = create_sample_graph()  # Convert input graph to NetworkX
         source = data.get('source', 'A')
         sink = data.get('sink', 'F')
@@ -154,8 +229,11 @@ def solve_max_flow():
 
 @app.route('/api/optimization/min-cost-flow', methods=['POST'])
 def solve_min_cost_flow():
+    from algorithms.optimization import min_cost_flow
+    from algorithms.utils import create_sample_graph
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         graph = create_sample_graph()  # Convert input graph to NetworkX
         source = data.get('source', 'A')
         sink = data.get('sink', 'F')
@@ -168,28 +246,34 @@ def solve_min_cost_flow():
 
 @app.route('/api/optimization/gradient-descent', methods=['POST'])
 def solve_gradient_descent():
+    from algorithms.optimization import (
+        gradient_descent,
+        sum_of_squares,
+        sum_of_squares_gradient
+    )
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         initial_point = data.get('initial_point', [2.0, 2.0])
         learning_rate = data.get('learning_rate', 0.1)
         max_iterations = data.get('max_iterations', 100)
+        method = data.get('method', 'standard')
+        momentum = data.get('momentum', 0.9)
         
-        def objective_fn(x):
-            return x[0]**2 + x[1]**2  # Example quadratic function
-            
-        def gradient_fn(x):
-            return [2*x[0], 2*x[1]]  # Gradient of the quadratic function
-            
-        steps = gradient_descent(objective_fn, gradient_fn, initial_point,
-                               learning_rate, max_iterations)
+        # Example quadratic function and its gradient, compiled at import
+        steps = gradient_descent(sum_of_squares, sum_of_squares_gradient, initial_point,
+                               learning_rate, max_iterations,
+                               method=method, momentum=momentum)
         return jsonify({'steps': steps})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/optimization/constrained', methods=['POST'])
 def solve_constrained():
+    from algorithms.optimization import constrained_optimization
+    
     try:
-        data = request.get_json()
+        data = g.json_body
         initial_point = data.get('initial_point', [2.0, 2.0])
         constraints = data.get('constraints', [])
         method = data.get('method', 'SLSQP')
@@ -204,41 +288,59 @@ def solve_constrained():
         return jsonify({'error': str(e)}), 500
 
 # Benchmarking endpoint
+@lru_cache(maxsize=128)
+def _run_benchmark(func: Callable, algorithm: str, input_sizes: Tuple[int, ...]) -> Dict:
+    """Benchmarks func on the generated inputs; cached since the inputs are fixed per size."""
+    import numpy as np
+    import networkx as nx
+    
+    def generate_input(size):
+        if algorithm in ['dfs', 'bfs', 'dijkstra', 'astar']:
+            # Random graph of the given size, seeded per size for reproducibility
+            rng = np.random.default_rng(42 + size)
+            graph = nx.gnp_random_graph(size, 0.2, seed=int(rng.integers(2**31)))
+            graph = nx.relabel_nodes(graph, str)  # Traversals take string labels
+            if algorithm in ['dfs', 'bfs']:
+                return (graph, '0')
+            return (graph, '0', str(size-1))
+        elif algorithm == 'knapsack':
+            return ([2]*size, [3]*size, size*2)
+        elif algorithm == 'lcs':
+            return ('A'*size, 'B'*size)
+        elif algorithm == 'matrix-chain':
+            return ([10]*(size+1),)
+        else:
+            raise ValueError(f'Unknown algorithm: {algorithm}')
+    
+    # Time the search itself rather than building visualization steps
+    if algorithm in ['dfs', 'bfs', 'dijkstra', 'astar']:
+        func = partial(func, visualize=False)
+    
+    # Analyze complexity
+    results = analyze_complexity(func, list(input_sizes), generate_input)
+    
+    # Estimate complexity class
+    results['estimated_complexity'] = estimate_complexity(
+        results['execution_times'],
+        results['input_sizes']
+    )
+    return results
+
 @app.route('/api/benchmark/<algorithm>', methods=['POST'])
 def benchmark_algorithm(algorithm):
     try:
-        data = request.get_json()
+        data = g.json_body
         input_sizes = data.get('input_sizes', [10, 20, 50, 100, 200, 500])
         
-        def generate_input(size):
-            if algorithm in ['dfs', 'bfs', 'dijkstra', 'astar']:
-                graph = create_sample_graph()  # Create graph of given size
-                return (graph, 'A', 'F')
-            elif algorithm == 'knapsack':
-                return ([2]*size, [3]*size, size*2)
-            elif algorithm == 'lcs':
-                return ('A'*size, 'B'*size)
-            elif algorithm == 'matrix-chain':
-                return ([10]*(size+1),)
-            else:
-                raise ValueError(f'Unknown algorithm: {algorithm}')
-        
         # Get the appropriate function based on algorithm
-        func = globals().get(algorithm)
-        if not func:
+        target = _ALGO_MAP.get(algorithm)
+        if target is None:
             return jsonify({'error': f'Unknown algorithm: {algorithm}'}), 400
+        module, name = target
+        func = getattr(import_module(module), name)
             
-        # Analyze complexity
-        results = analyze_complexity(func, input_sizes, generate_input)
-        
-        # Estimate complexity class
-        estimated_complexity = estimate_complexity(
-            results['execution_times'],
-            results['input_sizes']
-        )
-        
-        results['estimated_complexity'] = estimated_complexity
-        return jsonify(results)
+        # Repeated requests for the same sizes reuse the cached measurements
+        return jsonify(_run_benchmark(func, algorithm, tuple(input_sizes)))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1,9 +1,63 @@
 import json
 import os
 import traceback
+from functools import lru_cache
 from typing import Any, Dict, Tuple, Union
 
-from app import app
+import orjson
+from flask import g
+from werkzeug.http import parse_etags, unquote_etag
+
+from app import CATEGORIES_CACHE_CONTROL, CATEGORIES_JSON, DEBUG, HEALTH_JSON, app
+
+@lru_cache(maxsize=None)
+def _sample_graph_response() -> Tuple[int, str, Dict[str, str]]:
+    # Imported on first use so the other routes don't pay for NetworkX
+    from algorithms.utils import SAMPLE_GRAPH_JSON, SAMPLE_GRAPH_ETAG
+    
+    return (
+        200,
+        SAMPLE_GRAPH_JSON.decode('utf-8'),
+        {'Content-Type': 'application/json', 'ETag': f'"{SAMPLE_GRAPH_ETAG}"'}
+    )
+
+def _health_response() -> Tuple[int, str, Dict[str, str]]:
+    return (
+        200,
+        HEALTH_JSON.decode('utf-8'),
+        {'Content-Type': 'application/json'}
+    )
+
+def _categories_response() -> Tuple[int, str, Dict[str, str]]:
+    return (
+        200,
+        CATEGORIES_JSON.decode('utf-8'),
+        {'Content-Type': 'application/json', 'Cache-Control': CATEGORIES_CACHE_CONTROL}
+    )
+
+# Static GET routes served without going through Flask: (method, path) ->
+# function returning (status code, body, headers)
+STATIC_RESPONSES = {
+    ('GET', '/health'): _health_response,
+    ('GET', '/api/algorithms'): _categories_response,
+    ('GET', '/api/graph/sample'): _sample_graph_response,
+}
+
+def is_not_modified(event: Dict[str, Any], headers: Dict[str, str]) -> bool:
+    """Check whether the request's If-None-Match matches the response ETag."""
+    etag = headers.get('ETag')
+    if etag is None:
+        return False
+
+    # API Gateway passes header names through as the client sent them
+    if_none_match = next(
+        (value for name, value in (event.get('headers') or {}).items()
+         if name.lower() == 'if-none-match'),
+        None
+    )
+    if not if_none_match:
+        return False
+    return parse_etags(if_none_match).contains_weak(unquote_etag(etag)[0])
 
 def create_response(
     status_code: int,
@@ -27,6 +81,13 @@ def create_response(
         'body': json.dumps(body) if isinstance(body, dict) else body
     }
 
+def error_response(error: Exception) -> Dict[str, Any]:
+    """Create a 500 response, with the traceback only when DEBUG is set."""
+    payload = {'error': str(error)}
+    if DEBUG:
+        payload['traceback'] = traceback.format_exc()
+    return create_response(500, payload)
+
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """AWS Lambda handler function."""
     try:
@@ -38,42 +99,49 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         path = event.get('path', '')
         http_method = event.get('httpMethod', '')
         
+        # Serve static routes directly
+        static = STATIC_RESPONSES.get((http_method, path))
+        if static is not None:
+            status_code, body, headers = static()
+            headers = dict(headers)
+            if is_not_modified(event, headers):
+                del headers['Content-Type']
+                return create_response(304, '', headers)
+            return create_response(status_code, body, headers)
+        
         # Parse query string parameters
         query_params = event.get('queryStringParameters', {}) or {}
         
         # Parse request body
         body = {}
         if event.get('body'):
+            if len(event['body']) > app.config['MAX_CONTENT_LENGTH']:
+                return create_response(413, {'error': 'Request body too large'})
             try:
-                body = json.loads(event['body'])
-            except json.JSONDecodeError:
+                body = orjson.loads(event['body'])
+            except orjson.JSONDecodeError:
                 return create_response(400, {'error': 'Invalid JSON in request body'})
 
-        # Create Flask request context
+        # Create Flask request context; routes read the parsed body from g
+        # instead of decoding it again
         with app.test_request_context(
             path=path,
             method=http_method,
-            query_string=query_params,
-            json=body
+            query_string=query_params
         ):
+            g.json_body = body
             try:
                 # Process the request through Flask
                 response = app.full_dispatch_request()
+                # Pass the body through as encoded by the app's JSON provider
                 return create_response(
                     response.status_code,
-                    response.get_json() if response.is_json else response.get_data(as_text=True),
+                    response.get_data(as_text=True),
                     dict(response.headers)
                 )
             except Exception as e:
-                app.logger.error(f'Error processing request: {str(e)}')
-                app.logger.error(traceback.format_exc())
-                return create_response(500, {
-                    'error': str(e),
-                    'traceback': traceback.format_exc()
-                })
+                app.logger.exception(f'Error processing request: {str(e)}')
+                return error_response(e)
 
     except Exception as e:
-        return create_response(500, {
-            'error': str(e),
-            'traceback': traceback.format_exc()
-        }) 
\ No newline at end of file
+        return error_response(e)
\ No newline at end of file
@@ -1,4 +1,6 @@
-from flask import Blueprint, jsonify, request
+from functools import lru_cache, partial
+from typing import Dict, Tuple
+from flask import Blueprint, Response, g, jsonify, request
 from algorithms import (
     graph_traversal,
     dynamic_programming,
@@ -6,52 +8,52 @@ from algorithms import (
     utils
 )
 from utils.benchmarking import measure_performance, analyze_complexity, estimate_complexity
+from utils.streaming import steps_response
 import networkx as nx
 import numpy as np
 
 api = Blueprint('api', __name__)
 
+@api.before_request
+def load_json_body():
+    """Parse the request body once; the Lambda handler sets g.json_body itself."""
+    if 'json_body' not in g:
+        g.json_body = request.get_json() if request.method == 'POST' else None
+
+@api.errorhandler(nx.NodeNotFound)
+def handle_node_not_found(error):
+    """Report unknown start or end nodes as a bad request."""
+    return jsonify({'error': str(error)}), 400
+
 @api.route('/graph/sample', methods=['GET'])
 def get_sample_graph():
     """Get a sample graph for testing."""
-    graph = utils.create_sample_graph()
-    return jsonify({
-        'nodes': [{'id': node} for node in graph.nodes()],
-        'edges': [
-            {
-                'source': u,
-                'target': v,
-                'weight': graph[u][v].get('weight', 1)
-            }
-            for u, v in graph.edges()
-        ]
-    })
+    response = Response(utils.SAMPLE_GRAPH_JSON, mimetype='application/json')
+    response.set_etag(utils.SAMPLE_GRAPH_ETAG)
+    return response.make_conditional(request)
 
 @api.route('/graph/traverse/<algorithm>', methods=['POST'])
 def traverse_graph(algorithm):
     """Execute graph traversal algorithms."""
-    data = request.get_json()
+    data = g.json_body
     graph = nx.Graph()
     
     # Build graph from request data
-    for node in data['nodes']:
-        graph.add_node(node['id'])
-        if 'pos' in node:
-            graph.nodes[node['id']]['pos'] = node['pos']
-            
-    for edge in data['edges']:
-        graph.add_edge(
-            edge['source'],
-            edge['target'],
-            weight=edge.get('weight', 1)
-        )
+    graph.add_nodes_from(
+        (node['id'], {'pos': node['pos']} if 'pos' in node else {})
+        for node in data['nodes']
+    )
+    graph.add_edges_from(
+        (edge['source'], edge['target'], {'weight': edge.get('weight', 1)})
+        for edge in data['edges']
+    )
     
     if algorithm == 'dfs':
-        steps = graph_traversal.dfs(graph, data['start'])
+        steps = graph_traversal.iter_dfs(graph, data['start'])
     elif algorithm == 'bfs':
-        steps = graph_traversal.bfs(graph, data['start'])
+        steps = graph_traversal.iter_bfs(graph, data['start'])
     elif algorithm == 'dijkstra':
-        steps = graph_traversal.dijkstra(graph, data['start'], data['end'])
+        steps = graph_traversal.iter_dijkstra(graph, data['start'], data['end'])
     elif algorithm == 'astar':
         # Custom heuristic function if provided
         heuristic = None
@@ -62,7 +64,7 @@ def traverse_graph(algorithm):
                 pos2 = graph.nodes[n2]['pos']
                 return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
                 
-        steps = graph_traversal.astar(
+        steps = graph_traversal.iter_astar(
             graph,
             data['start'],
             data['end'],
@@ -71,12 +73,13 @@ def traverse_graph(algorithm):
     else:
         return jsonify({'error': 'Invalid algorithm'}), 400
     
-    return jsonify({'steps': steps})
+    # Streams NDJSON when the client accepts it
+    return steps_response(steps)
 
 @api.route('/dp/knapsack', methods=['POST'])
 def solve_knapsack():
     """Execute 0/1 Knapsack algorithm."""
-    data = request.get_json()
+    data = g.json_body
     steps = dynamic_programming.knapsack(
         weights=data['weights'],
         values=data['values'],
@@ -87,7 +90,7 @@ def solve_knapsack():
 @api.route('/dp/lcs', methods=['POST'])
 def solve_lcs():
     """Execute Longest Common Subsequence algorithm."""
-    data = request.get_json()
+    data = g.json_body
     steps = dynamic_programming.lcs(
         str1=data['str1'],
         str2=data['str2']
@@ -97,7 +100,7 @@ def solve_lcs():
 @api.route('/dp/matrix-chain', methods=['POST'])
 def solve_matrix_chain():
     """Execute Matrix Chain Multiplication algorithm."""
-    data = request.get_json()
+    data = g.json_body
     steps = dynamic_programming.matrix_chain(
         dimensions=data['dimensions']
     )
@@ -106,7 +109,7 @@ def solve_matrix_chain():
 @api.route('/optimization/simplex', methods=['POST'])
 def solve_simplex():
     """Execute Simplex algorithm for linear programming."""
-    data = request.get_json()
+    data = g.json_body
     steps = optimization.simplex(
         c=data['objective'],
         A=data['constraints'],
@@ -118,18 +121,15 @@ def solve_simplex():
 @api.route('/optimization/max-flow', methods=['POST'])
 def solve_max_flow():
     """Execute Maximum Flow algorithm."""
-    data = request.get_json()
+    data = g.json_body
     graph = nx.DiGraph()
     
     # Build graph from request data
-    for node in data['nodes']:
-        graph.add_node(node['id'])
-    for edge in data['edges']:
-        graph.add_edge(
-            edge['source'],
-            edge['target'],
-            capacity=edge.get('capacity', 1)
-        )
+    graph.add_nodes_from(node['id'] for node in data['nodes'])
+    graph.add_edges_from(
+        (edge['source'], edge['target'], {'capacity': edge.get('capacity', 1)})
+        for edge in data['edges']
+    )
     
     steps = optimization.max_flow(
         graph=graph,
@@ -141,19 +141,19 @@ def solve_max_flow():
 @api.route('/optimization/min-cost-flow', methods=['POST'])
 def solve_min_cost_flow():
     """Execute Minimum Cost Flow algorithm."""
-    data = request.get_json()
+    data = g.json_body
     graph = nx.DiGraph()
     
     # Build graph from request data
-    for node in data['nodes']:
-        graph.add_node(node['id'])
-    for edge in data['edges']:
-        graph.add_edge(
+    graph.add_nodes_from(node['id'] for node in data['nodes'])
+    graph.add_edges_from(
+        (
             edge['source'],
             edge['target'],
-            capacity=edge.get('capacity', 1),
-            cost=edge.get('cost', 1)
+            {'capacity': edge.get('capacity', 1), 'cost': edge.get('cost', 1)}
         )
+        for edge in data['edges']
+    )
     
     steps = optimization.min_cost_flow(
         graph=graph,
@@ -166,34 +166,32 @@ def solve_min_cost_flow():
 @api.route('/optimization/gradient-descent', methods=['POST'])
 def solve_gradient_descent():
     """Execute gradient descent optimization."""
-    data = request.get_json()
-    
-    # Define the objective function and its gradient
-    def objective_fn(x):
-        return np.sum(x**2)  # Example: minimize sum of squares
-        
-    def gradient_fn(x):
-        return 2 * x  # Gradient of sum of squares
+    data = g.json_body
     
     initial_point = np.array(data['initial_point'])
     learning_rate = data.get('learning_rate', 0.01)
     max_iterations = data.get('max_iterations', 1000)
     tolerance = data.get('tolerance', 1e-6)
+    method = data.get('method', 'standard')
+    momentum = data.get('momentum', 0.9)
     
     steps = optimization.gradient_descent(
-        objective_fn=objective_fn,
-        gradient_fn=gradient_fn,
+        # Example: minimize sum of squares
+        objective_fn=optimization.sum_of_squares,
+        gradient_fn=optimization.sum_of_squares_gradient,
         initial_point=initial_point,
         learning_rate=learning_rate,
         max_iterations=max_iterations,
-        tolerance=tolerance
+        tolerance=tolerance,
+        method=method,
+        momentum=momentum
     )
     return jsonify({'steps': steps})
 
 @api.route('/optimization/constrained', methods=['POST'])
 def solve_constrained():
     """Execute constrained nonlinear optimization."""
-    data = request.get_json()
+    data = g.json_body
     
     # Define the objective function
     def objective_fn(x):
@@ -211,52 +209,55 @@ def solve_constrained():
     )
     return jsonify({'steps': steps})
 
-@api.route('/benchmark/<algorithm>', methods=['POST'])
-def benchmark_algorithm(algorithm):
-    """Benchmark algorithm performance with different input sizes."""
-    data = request.get_json()
-    input_sizes = data.get('input_sizes', [10, 50, 100, 500, 1000])
+@lru_cache(maxsize=128)
+def _run_benchmark(algorithm: str, input_sizes: Tuple[int, ...], seed: int) -> Dict:
+    """Benchmark an algorithm on inputs generated from seed; cached per arguments."""
+    rng = np.random.default_rng(seed)
+    nucleotides = np.frombuffer(b'ACGT', dtype='S1')
     
     def generate_graph_input(size):
         """Generate random graph of given size."""
-        G = nx.gnp_random_graph(size, 0.2)
-        nodes = [{'id': str(i)} for i in range(size)]
-        edges = [
-            {
-                'source': str(u),
-                'target': str(v),
-                'weight': 1
-            }
-            for u, v in G.edges()
-        ]
+        G = nx.relabel_nodes(nx.gnp_random_graph(size, 0.2, seed=rng), str)
+        if algorithm == 'dfs':
+            return [G, '0']
         return [G, '0', str(size-1)]  # For pathfinding algorithms
     
+    def generate_csr_input(size):
+        """Generate random graph of given size as CSR arrays."""
+        G = nx.gnp_random_graph(size, 0.2, seed=rng)
+        indptr, indices, _ = graph_traversal.to_csr(G)
+        return [indptr, indices, 0]
+    
     def generate_dp_input(size):
         """Generate random input for dynamic programming."""
         if algorithm == 'knapsack':
-            weights = np.random.randint(1, 100, size=size).tolist()
-            values = np.random.randint(1, 100, size=size).tolist()
+            weights = rng.integers(1, 100, size=size).tolist()
+            values = rng.integers(1, 100, size=size).tolist()
             capacity = int(sum(weights) * 0.3)
             return [weights, values, capacity]
         elif algorithm == 'lcs':
-            str1 = ''.join(np.random.choice(list('ACGT'), size=size))
-            str2 = ''.join(np.random.choice(list('ACGT'), size=size))
+            str1 = rng.choice(nucleotides, size=size).tobytes().decode()
+            str2 = rng.choice(nucleotides, size=size).tobytes().decode()
             return [str1, str2]
         else:  # matrix-chain
-            dimensions = np.random.randint(1, 100, size=size+1).tolist()
+            dimensions = rng.integers(1, 100, size=size+1).tolist()
             return [dimensions]
     
     # Select appropriate input generator and function
-    if algorithm in ['dfs', 'bfs', 'dijkstra', 'astar']:
+    if algorithm == 'bfs':
+        # Converted to CSR up front so only the traversal is timed
+        generate_input = generate_csr_input
+        func = graph_traversal.bfs_csr
+    elif algorithm in ['dfs', 'dijkstra', 'astar']:
         generate_input = generate_graph_input
         if algorithm == 'dfs':
             func = graph_traversal.dfs
-        elif algorithm == 'bfs':
-            func = graph_traversal.bfs
         elif algorithm == 'dijkstra':
             func = graph_traversal.dijkstra
         else:
             func = graph_traversal.astar
+        # Time the search itself rather than building visualization steps
+        func = partial(func, visualize=False)
     else:
         generate_input = generate_dp_input
         if algorithm == 'knapsack':
@@ -267,7 +268,7 @@ def benchmark_algorithm(algorithm):
             func = dynamic_programming.matrix_chain
     
     # Run benchmarks
-    results = analyze_complexity(func, input_sizes, generate_input)
+    results = analyze_complexity(func, list(input_sizes), generate_input)
     
     # Estimate complexity
     estimated_complexity = estimate_complexity(
@@ -275,9 +276,19 @@ def benchmark_algorithm(algorithm):
         results['input_sizes']
     )
     
-    return jsonify({
+    return {
         'input_sizes': results['input_sizes'],
         'execution_times': results['execution_times'],
         'memory_usage': results['memory_usage'],
         'estimated_complexity': estimated_complexity
-    }) 
\ No newline at end of file
+    }
+
+@api.route('/benchmark/<algorithm>', methods=['POST'])
+def benchmark_algorithm(algorithm):
+    """Benchmark algorithm performance with different input sizes."""
+    data = g.json_body
+    input_sizes = data.get('input_sizes', [10, 50, 100, 500, 1000])
+    seed = int(data.get('seed', 0))
+    
+    # Inputs are generated from the seed, so repeated requests reuse results
+    return jsonify(_run_benchmark(algorithm, tuple(input_sizes), seed))
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The backend runs with both the repository root (for `algorithms`) and the
+# backend directory (for `app`, `routes` and `utils`) on the path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.dirname(BACKEND_DIR), BACKEND_DIR]
@@ -0,0 +1,74 @@
+import networkx as nx
+import pytest
+
+from algorithms import graph_traversal
+from algorithms.utils import create_sample_graph
+
+@pytest.mark.parametrize('visualize', [True, False])
+@pytest.mark.parametrize('search, args', [
+    (graph_traversal.dfs, ('Z',)),
+    (graph_traversal.bfs, ('Z',)),
+    (graph_traversal.dijkstra, ('Z', 'F')),
+    (graph_traversal.dijkstra, ('A', 'Z')),
+    (graph_traversal.astar, ('A', 'Z')),
+])
+def test_missing_node_raises_node_not_found(search, args, visualize):
+    with pytest.raises(nx.NodeNotFound):
+        search(create_sample_graph(), *args, visualize=visualize)
+
+def test_astar_custom_heuristic_ignores_unusable_positions():
+    graph = nx.Graph()
+    graph.add_node('A', pos=None)
+    graph.add_node('B', pos=(1, 2, 3))
+    graph.add_node('C', pos=(0, 0))
+    graph.add_edges_from([('A', 'B', {'weight': 1}), ('B', 'C', {'weight': 1})])
+
+    steps = graph_traversal.astar(graph, 'A', 'C', lambda n1, n2: 0.0)
+
+    assert steps[-1]['path'] == ['A', 'B', 'C']
+
+def test_astar_default_heuristic_matches_dijkstra():
+    graph = create_sample_graph()
+
+    assert (graph_traversal.astar(graph, 'A', 'F')[-1]['path'] ==
+            graph_traversal.dijkstra(graph, 'A', 'F')[-1]['path'])
+
+def test_astar_custom_heuristic_only_sees_reachable_nodes():
+    graph = nx.Graph()
+    graph.add_nodes_from([('A', {'pos': (0, 0)}), ('B', {'pos': (1, 0)}), ('C', {})])
+    graph.add_edge('A', 'B', weight=1)
+    seen = []
+
+    def heuristic(n1, n2):
+        seen.append(n1)
+        pos1, pos2 = graph.nodes[n1]['pos'], graph.nodes[n2]['pos']
+        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+
+    steps = graph_traversal.astar(graph, 'A', 'B', heuristic)
+
+    assert steps[-1]['path'] == ['A', 'B']
+    assert 'C' not in seen
+
+@pytest.mark.parametrize('directed', [False, True])
+def test_bfs_levels_and_parents_on_large_graph(directed):
+    # Large and dense enough for the direction-optimizing BFS to switch to
+    # pull steps and back
+    graph = nx.gnp_random_graph(1500, 0.01, seed=7, directed=directed)
+    assert graph.number_of_nodes() >= graph_traversal._PULL_MIN_NODES
+    nodes, indptr, indices, _ = graph_traversal._to_csr(graph)
+    start = nodes.index(0)
+
+    order, parent = graph_traversal._bfs_graph_csr(graph, indptr, indices, start)
+
+    expected = nx.single_source_shortest_path_length(graph, 0)
+    assert order[0] == start
+    assert {nodes[u] for u in order.tolist()} == set(expected)
+
+    level = {nodes[start]: 0}
+    for v in order[1:].tolist():
+        u = parent[v]
+        assert graph.has_edge(nodes[u], nodes[v])
+        level[nodes[v]] = level[nodes[u]] + 1
+    assert level == expected
+    # Nodes are visited level by level
+    assert [level[nodes[u]] for u in order.tolist()] == sorted(level.values())
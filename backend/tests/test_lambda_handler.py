@@ -0,0 +1,45 @@
+from algorithms.utils import SAMPLE_GRAPH_ETAG
+from lambda_handler import app, handler
+
+def sample_graph_event(headers=None):
+    return {'httpMethod': 'GET', 'path': '/api/graph/sample', 'headers': headers}
+
+def test_sample_graph_sends_etag():
+    response = handler(sample_graph_event(), None)
+
+    assert response['statusCode'] == 200
+    assert response['headers']['ETag'] == f'"{SAMPLE_GRAPH_ETAG}"'
+    assert response['body']
+
+def test_sample_graph_not_modified():
+    for name in ('If-None-Match', 'if-none-match'):
+        response = handler(sample_graph_event({name: f'"{SAMPLE_GRAPH_ETAG}"'}), None)
+
+        assert response['statusCode'] == 304
+        assert response['body'] == ''
+        assert response['headers']['ETag'] == f'"{SAMPLE_GRAPH_ETAG}"'
+
+def test_sample_graph_stale_etag():
+    response = handler(sample_graph_event({'If-None-Match': '"stale"'}), None)
+
+    assert response['statusCode'] == 200
+    assert response['body']
+
+def test_body_is_passed_through():
+    body = '{"start": "A", "end": "F"}'
+    event = {'httpMethod': 'POST', 'path': '/api/graph/traverse/dijkstra', 'body': body}
+    response = handler(event, None)
+    expected = app.test_client().post(
+        '/api/graph/traverse/dijkstra', data=body, content_type='application/json'
+    )
+
+    assert response['statusCode'] == 200
+    # Unreached distances are encoded as null by the app, not re-encoded as Infinity
+    assert response['body'] == expected.get_data(as_text=True)
+
+def test_health_matches_flask_route():
+    response = handler({'httpMethod': 'GET', 'path': '/health'}, None)
+    expected = app.test_client().get('/health')
+
+    assert response['statusCode'] == expected.status_code == 200
+    assert response['body'] == expected.get_data(as_text=True)
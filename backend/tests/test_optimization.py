@@ -0,0 +1,55 @@
+import math
+
+import networkx as nx
+from scipy.optimize import linprog
+
+from algorithms.optimization import max_flow, min_cost_flow, simplex
+
+def test_simplex_minimization_with_zero_optimum():
+    c, A, b = [1, 2], [[1, 1], [1, -1]], [4, 2]
+    final = simplex(c, A, b, maximize=False)[-1]
+    highs = linprog(c, A_ub=A, b_ub=b, method='highs')
+
+    assert final['objective_value'] == highs.fun == 0.0
+    # -0.0 would serialize as "-0.0"
+    assert math.copysign(1.0, final['objective_value']) == 1.0
+    assert final['message'] == 'Found optimal solution with objective value: 0.0'
+
+def test_simplex_maximization_matches_highs():
+    c, A, b = [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]
+    final = simplex(c, A, b, maximize=True)[-1]
+    highs = linprog([-x for x in c], A_ub=A, b_ub=b, method='highs')
+
+    assert math.isclose(final['objective_value'], -highs.fun)
+    assert all(math.isclose(x, y, abs_tol=1e-9) for x, y in zip(final['solution'], highs.x))
+
+def flow_graph():
+    graph = nx.DiGraph()
+    graph.add_edges_from([
+        ('A', 'B', {'capacity': 3, 'cost': 1}),
+        ('A', 'C', {'capacity': 2, 'cost': 2}),
+        ('B', 'C', {'capacity': 1, 'cost': 1}),
+        ('B', 'D', {'capacity': 2, 'cost': 3}),
+        ('C', 'D', {'capacity': 3, 'cost': 1}),
+    ])
+    return graph
+
+def replayed_flows(steps, cancel_reverse):
+    # The replay rule materializeFlowSteps in frontend/src/services/api.ts applies
+    flows = {}
+    for step in steps[1:-1]:
+        for u, v in step['current_path']:
+            flows[u, v] = flows.get((u, v), 0) + step['delta']
+            if cancel_reverse:
+                flows[v, u] = flows.get((v, u), 0) - step['delta']
+    return flows
+
+def test_flow_deltas_replay_to_final_graph():
+    for steps, cancel_reverse in (
+        (max_flow(flow_graph(), 'A', 'D'), True),
+        (min_cost_flow(flow_graph(), 'A', 'D', 4), False),
+    ):
+        assert len(steps) > 2
+        flows = replayed_flows(steps, cancel_reverse)
+        for u, v, data in steps[-1]['graph']['edges']:
+            assert data['flow'] == flows.get((u, v), 0)
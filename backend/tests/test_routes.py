@@ -0,0 +1,26 @@
+from flask import Flask, g
+
+from routes import api
+
+def blueprint_app():
+    app = Flask(__name__)
+    app.register_blueprint(api, url_prefix='/api')
+    return app
+
+def test_blueprint_parses_request_body():
+    response = blueprint_app().test_client().post(
+        '/api/dp/lcs', json={'str1': 'AB', 'str2': 'B'}
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()['steps']
+
+def test_blueprint_reads_preparsed_body():
+    # The Lambda handler dispatches without a request body and sets g.json_body
+    app = blueprint_app()
+    with app.test_request_context(path='/api/dp/lcs', method='POST'):
+        g.json_body = {'str1': 'AB', 'str2': 'B'}
+        response = app.full_dispatch_request()
+
+    assert response.status_code == 200
+    assert response.get_json()['steps']
@@ -1,17 +1,40 @@
+import gc
+import sys
 import time
-import tracemalloc
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from functools import wraps
 
+try:
+    import resource
+except ImportError:  # Windows has no getrusage; memory is reported as None
+    resource = None
+
+# Timed runs per input size in analyze_complexity
+_TIMING_REPEATS = 3
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+def _peak_rss() -> Optional[int]:
+    """Returns the peak resident set size of this process in bytes, or None if unavailable."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
 def measure_performance(func: Callable) -> Callable:
     """
     Decorator to measure execution time and memory usage of algorithms.
+    
+    Memory is sampled from the process peak RSS before and after the call,
+    so memory_usage only counts growth beyond the previous peak; unlike
+    tracemalloc this adds no overhead to the timed call. Both memory metrics
+    are None where the resource module is unavailable (Windows).
     """
     @wraps(func)
     def wrapper(*args, **kwargs) -> Tuple[List[Dict], Dict[str, Any]]:
         # Start memory tracking
-        tracemalloc.start()
-        start_memory = tracemalloc.get_traced_memory()[0]
+        gc.collect()
+        start_memory = _peak_rss()
         
         # Measure execution time
         start_time = time.perf_counter()
@@ -19,9 +42,8 @@ def measure_performance(func: Callable) -> Callable:
         execution_time = time.perf_counter() - start_time
         
         # Get memory usage
-        current_memory, peak_memory = tracemalloc.get_traced_memory()
-        memory_increase = current_memory - start_memory
-        tracemalloc.stop()
+        peak_memory = _peak_rss()
+        memory_increase = None if peak_memory is None else max(0, peak_memory - start_memory)
         
         # Add performance metrics to the result
         metrics = {
@@ -55,15 +77,25 @@ def analyze_complexity(
         'execution_times': [],
         'memory_usage': [],
     }
+    measured = measure_performance(func)
+    
+    # Warm up lazy imports, JIT compilation and caches on the smallest input
+    # so they are not billed to the first measured size
+    if input_sizes:
+        func(*generate_input(min(input_sizes)))
     
     for size in input_sizes:
         # Generate input data
         args = generate_input(size)
         
-        # Measure performance
-        _, metrics = measure_performance(func)(*args)
+        # Measure performance; the fastest of a few runs is the least noisy
+        # estimate, while memory comes from the first run
+        _, metrics = measured(*args)
+        execution_time = metrics['execution_time']
+        for _ in range(_TIMING_REPEATS - 1):
+            execution_time = min(execution_time, measured(*args)[1]['execution_time'])
         
-        results['execution_times'].append(metrics['execution_time'])
+        results['execution_times'].append(execution_time)
         results['memory_usage'].append(metrics['memory_usage'])
     
     return results
@@ -80,56 +112,33 @@ def estimate_complexity(times: List[float], sizes: List[int]) -> str:
         String describing the estimated complexity
     """
     import numpy as np
-    from scipy.optimize import curve_fit
-    
-    def constant(n, a):
-        return a * np.ones_like(n)
-    
-    def linear(n, a):
-        return a * n
-    
-    def log(n, a):
-        return a * np.log(n)
     
-    def nlogn(n, a):
-        return a * n * np.log(n)
-    
-    def quadratic(n, a):
-        return a * n**2
-    
-    def cubic(n, a):
-        return a * n**3
-    
-    def exponential(n, a):
-        return a * 2**n
-    
-    # Functions to test against
-    functions = [
-        (constant, 'O(1)'),
-        (linear, 'O(n)'),
-        (log, 'O(log n)'),
-        (nlogn, 'O(n log n)'),
-        (quadratic, 'O(n²)'),
-        (cubic, 'O(n³)'),
-        (exponential, 'O(2ⁿ)'),
-    ]
-    
-    best_error = float('inf')
-    best_complexity = 'Unknown'
-    
-    x = np.array(sizes)
-    y = np.array(times)
-    
-    for func, complexity in functions:
-        try:
-            popt, _ = curve_fit(func, x, y)
-            y_pred = func(x, *popt)
-            error = np.mean((y - y_pred)**2)
-            
-            if error < best_error:
-                best_error = error
-                best_complexity = complexity
-        except:
-            continue
-    
-    return best_complexity 
\ No newline at end of file
+    # Candidate models a * f(n), in order of preference on ties
+    complexities = ['O(1)', 'O(n)', 'O(log n)', 'O(n log n)', 'O(n²)', 'O(n³)', 'O(2ⁿ)']
+    
+    x = np.asarray(sizes, dtype=np.float64)
+    y = np.asarray(times, dtype=np.float64)
+    
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        basis = np.vstack([
+            np.ones_like(x),
+            x,
+            np.log(x),
+            x * np.log(x),
+            x ** 2,
+            x ** 3,
+            2 ** x,
+        ])
+        
+        # Each model has one coefficient, so the least-squares fit is closed
+        # form: a = <f, y> / <f, f>
+        norms = np.einsum('ij,ij->i', basis, basis)
+        coeffs = basis @ y / norms
+        errors = np.mean((y - coeffs[:, None] * basis) ** 2, axis=1)
+    
+    # Models that overflow or vanish on these sizes cannot be fitted
+    errors[~np.isfinite(errors) | ~np.isfinite(norms) | (norms == 0)] = np.inf
+    
+    if len(x) == 0 or not np.isfinite(errors).any():
+        return 'Unknown'
+    return complexities[int(np.argmin(errors))]
@@ -0,0 +1,55 @@
+from itertools import chain
+from typing import Callable, Dict, Iterator
+from flask import Response, current_app, jsonify, request
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+def wants_ndjson() -> bool:
+    """
+    Checks whether the client asked for newline-delimited JSON.
+
+    Plain JSON wins ties (e.g. Accept: */*), so existing clients are unaffected.
+    """
+    return request.accept_mimetypes.best_match(
+        ['application/json', NDJSON_MIMETYPE]
+    ) == NDJSON_MIMETYPE
+
+def ndjson(steps: Iterator[Dict], dumps: Callable[[Dict], str]) -> Iterator[str]:
+    """
+    Encodes steps as newline-delimited JSON, one step per line.
+
+    Args:
+        steps: Iterator over visualization steps
+        dumps: JSON encoder for a single step
+
+    Returns:
+        Iterator over encoded lines
+    """
+    for step in steps:
+        yield dumps(step) + '\n'
+
+def steps_response(steps: Iterator[Dict]) -> Response:
+    """
+    Returns visualization steps as a streamed NDJSON response or a {'steps': [...]} body.
+
+    The first step is computed before responding so that invalid input
+    still raises inside the caller's error handling.
+
+    Args:
+        steps: Iterator over visualization steps
+
+    Returns:
+        Flask response
+    """
+    if not wants_ndjson():
+        return jsonify({'steps': list(steps)})
+
+    steps = iter(steps)
+    first = next(steps, None)
+    head = [] if first is None else [first]
+    # The app's JSON provider is bound here since the body is generated
+    # after the app context has been torn down
+    return Response(
+        ndjson(chain(head, steps), current_app.json.dumps),
+        mimetype=NDJSON_MIMETYPE
+    )
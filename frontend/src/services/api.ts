@@ -39,10 +39,71 @@ export interface Step {
   current: string;
   next?: string;
   distances?: { [key: string]: number };
+  distance_update?: [string, number] | null;
   path?: string[];
   message: string;
 }
 
+// Graph steps arrive as parallel node/edge columns; rebuild the node and
+// edge objects the visualizer expects.
+export const expandGraphStep = (step: any): Step => {
+  if (!step.node_ids) {
+    return step;
+  }
+
+  const {
+    node_ids,
+    node_states,
+    node_values,
+    node_distances,
+    edge_sources,
+    edge_targets,
+    edge_weights,
+    edge_states,
+    ...rest
+  } = step;
+
+  return {
+    ...rest,
+    nodes: node_ids.map((id: string, i: number) => ({
+      id,
+      value: node_values[i],
+      state: node_states[i],
+      ...(node_distances && { distance: node_distances[i] }),
+    })),
+    edges: edge_sources.map((source: string, i: number) => ({
+      source,
+      target: edge_targets[i],
+      weight: edge_weights[i],
+      state: edge_states[i],
+    })),
+  };
+};
+
+// Shortest-path steps only carry the distance they changed; replay them on
+// top of the last full snapshot so every step has complete distances.
+export const materializeGraphSteps = (steps: Step[]): Step[] => {
+  let distances: { [key: string]: number } | undefined;
+
+  return steps.map((step) => {
+    if (step.distances) {
+      distances = { ...step.distances };
+      return step;
+    }
+
+    if (!distances) {
+      return step;
+    }
+
+    if (step.distance_update) {
+      const [node, distance] = step.distance_update;
+      distances[node] = distance;
+    }
+
+    return { ...step, distances: { ...distances } };
+  });
+};
+
 export const graphApi = {
   getSampleGraph: async (): Promise<Graph> => {
     const response = await api.get("/graph/sample");
@@ -61,7 +122,7 @@ export const graphApi = {
       start,
       end,
     });
-    return response.data.steps;
+    return materializeGraphSteps(response.data.steps.map(expandGraphStep));
   },
 };
 
@@ -80,20 +141,53 @@ export interface MatrixChainInput {
   dimensions: number[];
 }
 
+// DP fill steps only carry the cell they wrote; replay them on top of the
+// last full snapshot so every step has a complete table.
+export const materializeDpSteps = (steps: any[]): any[] => {
+  let dpTable: number[][] = [];
+  let parenthesis: number[][] = [];
+
+  return steps.map((step) => {
+    if (step.dp_table) {
+      dpTable = step.dp_table.map((row: number[]) => [...row]);
+      if (step.parenthesis) {
+        parenthesis = step.parenthesis.map((row: number[]) => [...row]);
+      }
+      return step;
+    }
+
+    if (step.cell) {
+      const [row, col] = step.cell;
+      dpTable[row][col] = step.value;
+      if (step.split !== undefined) {
+        parenthesis[row][col] = step.split;
+      }
+    }
+
+    return {
+      ...step,
+      dp_table: dpTable.map((row) => [...row]),
+      ...(parenthesis.length && {
+        parenthesis: parenthesis.map((row) => [...row]),
+      }),
+    };
+  });
+};
+
 export const dpApi = {
   solveKnapsack: async (input: KnapsackInput): Promise<Step[]> => {
     const response = await api.post("/dp/knapsack", input);
-    return response.data.steps;
+    return materializeDpSteps(response.data.steps);
   },
 
   solveLCS: async (input: LCSInput): Promise<Step[]> => {
     const response = await api.post("/dp/lcs", input);
-    return response.data.steps;
+    return materializeDpSteps(response.data.steps);
   },
 
   solveMatrixChain: async (input: MatrixChainInput): Promise<Step[]> => {
     const response = await api.post("/dp/matrix-chain", input);
-    return response.data.steps;
+    return materializeDpSteps(response.data.steps);
   },
 };
 
@@ -126,6 +220,8 @@ export interface NonlinearInput {
   learning_rate?: number;
   max_iterations?: number;
   tolerance?: number;
+  method?: "standard" | "nesterov";
+  momentum?: number;
 }
 
 export interface ConstrainedInput {
@@ -138,6 +234,48 @@ export interface ConstrainedInput {
   method?: string;
 }
 
+// Flow augmentation steps only carry the path and its flow delta; replay
+// them on top of the last full graph so every step has complete edges.
+// Max flow also cancels flow on each reverse edge, creating it if needed.
+export const materializeFlowSteps = (steps: any[]): any[] => {
+  let nodes: string[] = [];
+  let adjacency: Map<string, Map<string, any>> = new Map();
+
+  return steps.map((step) => {
+    if (step.graph) {
+      nodes = [...step.graph.nodes];
+      adjacency = new Map(nodes.map((node) => [node, new Map()]));
+      step.graph.edges.forEach(([u, v, data]: [string, string, any]) => {
+        adjacency.get(u)!.set(v, { ...data });
+      });
+      return step;
+    }
+
+    if (step.delta !== undefined) {
+      step.current_path.forEach(([u, v]: [string, string]) => {
+        adjacency.get(u)!.get(v).flow += step.delta;
+        if (step.type === "max_flow") {
+          const reverse = adjacency.get(v)!;
+          if (!reverse.has(u)) {
+            reverse.set(u, { capacity: 0, flow: 0 });
+          }
+          reverse.get(u).flow -= step.delta;
+        }
+      });
+    }
+
+    return {
+      ...step,
+      graph: {
+        nodes: [...nodes],
+        edges: nodes.flatMap((u) =>
+          Array.from(adjacency.get(u)!, ([v, data]) => [u, v, { ...data }])
+        ),
+      },
+    };
+  });
+};
+
 export const optimizationApi = {
   solveSimplex: async (input: SimplexInput): Promise<Step[]> => {
     const response = await api.post("/optimization/simplex", input);
@@ -151,7 +289,7 @@ export const optimizationApi = {
       source: input.source,
       sink: input.sink,
     });
-    return response.data.steps;
+    return materializeFlowSteps(response.data.steps);
   },
 
   solveMinCostFlow: async (input: NetworkFlowInput): Promise<Step[]> => {
@@ -162,7 +300,7 @@ export const optimizationApi = {
       sink: input.sink,
       demand: input.demand,
     });
-    return response.data.steps;
+    return materializeFlowSteps(response.data.steps);
   },
 
   solveGradientDescent: async (